@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import re
 from enum import Enum
 
@@ -10,20 +10,25 @@ class BiasType(Enum):
 
 class BiasDetector:
     def __init__(self):
-        # Initialize bias detection patterns
+        # Initialize bias detection patterns, each paired with a literal that
+        # every match contains so the regex only runs when a literal is present
         self.gender_bias_patterns = [
-            r"only (men|women) can",
-            r"(men|women) are better at",
-            r"typical (male|female) job",
-            r"(he|she) would be better"
+            ("only ", r"only (men|women) can"),
+            ("are better at", r"(men|women) are better at"),
+            ("typical ", r"typical (male|female) job"),
+            ("would be better", r"(he|she) would be better")
         ]
         
         self.age_bias_patterns = [
-            r"too (young|old) for",
-            r"age requirement",
-            r"(young|old) people can't"
+            ("too ", r"too (young|old) for"),
+            ("age requirement", r"age requirement"),
+            ("people can't", r"(young|old) people can't")
         ]
         
+        # One compiled alternation per category so each is a single regex scan
+        self.gender_bias_anchors, self.gender_bias_regex = self._compile_category(self.gender_bias_patterns)
+        self.age_bias_anchors, self.age_bias_regex = self._compile_category(self.age_bias_patterns)
+        
         self.inclusive_alternatives = {
             "chairman": "chairperson",
             "businessman": "business person",
@@ -31,29 +36,42 @@ class BiasDetector:
             "stewardess": "flight attendant",
             "mankind": "humanity"
         }
+        # Whole words only, so e.g. "humankind" is not flagged as "mankind"
+        self.inclusive_pattern = re.compile(
+            r"\b(" + "|".join(map(re.escape, self.inclusive_alternatives)) + r")\b"
+        )
         
-    def detect_bias(self, text: str) -> Tuple[BiasType, float, str]:
+    def detect_bias(self, text: str, text_lower: Optional[str] = None) -> Tuple[BiasType, float, str]:
         """
         Detect bias in text and return bias type, confidence score, and suggestion.
+        Callers that already lowercased the text can pass it as text_lower.
         """
+        if text_lower is None:
+            text_lower = text.lower()
+        
         # Check for gender bias
-        for pattern in self.gender_bias_patterns:
-            if re.search(pattern, text.lower()):
-                return (BiasType.GENDER, 0.8, self._get_inclusive_suggestion(text))
+        if any(anchor in text_lower for anchor in self.gender_bias_anchors) and self.gender_bias_regex.search(text_lower):
+            return (BiasType.GENDER, 0.8, self._get_inclusive_suggestion(text_lower))
                 
         # Check for age bias
-        for pattern in self.age_bias_patterns:
-            if re.search(pattern, text.lower()):
-                return (BiasType.AGE, 0.7, "Consider focusing on skills and experience rather than age")
+        if any(anchor in text_lower for anchor in self.age_bias_anchors) and self.age_bias_regex.search(text_lower):
+            return (BiasType.AGE, 0.7, "Consider focusing on skills and experience rather than age")
                 
         return (BiasType.NONE, 0.0, "")
         
-    def _get_inclusive_suggestion(self, text: str) -> str:
-        """Generate inclusive language suggestions."""
-        text_lower = text.lower()
-        for biased, inclusive in self.inclusive_alternatives.items():
-            if biased in text_lower:
-                return f"Consider using '{inclusive}' instead of '{biased}'"
+    @staticmethod
+    def _compile_category(patterns: List[Tuple[str, str]]) -> Tuple[Tuple[str, ...], re.Pattern]:
+        """Combine a category's (anchor, pattern) pairs into its anchors and one alternation."""
+        anchors = tuple(anchor for anchor, _ in patterns)
+        regex = re.compile("|".join(f"(?:{pattern})" for _, pattern in patterns))
+        return anchors, regex
+        
+    def _get_inclusive_suggestion(self, text_lower: str) -> str:
+        """Generate inclusive language suggestions from already-lowercased text."""
+        match = self.inclusive_pattern.search(text_lower)
+        if match:
+            biased = match.group(1)
+            return f"Consider using '{self.inclusive_alternatives[biased]}' instead of '{biased}'"
         return "Consider using more inclusive language"
         
     def check_response_bias(self, response: str) -> bool:
@@ -61,6 +79,16 @@ class BiasDetector:
         bias_type, confidence, _ = self.detect_bias(response)
         return bias_type != BiasType.NONE and confidence > 0.6
         
+    def get_response_alternative(self, response: str) -> Optional[str]:
+        """
+        Return the inclusive alternative for a biased response, or None if it is fine.
+        Combines check_response_bias and get_inclusive_alternative in one scan.
+        """
+        bias_type, confidence, suggestion = self.detect_bias(response)
+        if bias_type != BiasType.NONE and confidence > 0.6:
+            return suggestion
+        return None
+        
     def get_inclusive_alternative(self, text: str) -> str:
         """Get inclusive alternative for potentially biased text."""
         bias_type, _, suggestion = self.detect_bias(text)
@@ -1,7 +1,6 @@
 from typing import Dict, List, Optional
 import json
 import aiohttp
-import pandas as pd
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -88,6 +87,26 @@ class KnowledgeBase:
             }
         }
         
+        self._build_indexes()
+        
+    def _build_indexes(self):
+        """Index events by category and mentorship programs by expertise area."""
+        # One lowercased search string per job; NUL separators keep a query from
+        # matching across field boundaries
+        self.job_search_text: Dict[str, str] = {
+            job_id: "\0".join([job['title'], job['description'], *job['requirements']]).lower()
+            for job_id, job in self.job_listings.items()
+        }
+        
+        self.events_by_category: Dict[str, List[Dict]] = {}
+        for event in self.events.values():
+            self.events_by_category.setdefault(event['category'].lower(), []).append(event)
+        
+        self.mentorship_by_expertise: Dict[str, List[Dict]] = {}
+        for program in self.mentorship_programs.values():
+            for area in dict.fromkeys(program['expertise_areas']):
+                self.mentorship_by_expertise.setdefault(area, []).append(program)
+        
     async def update_job_listings(self, api_key: str) -> None:
         """Update job listings from external API."""
         try:
@@ -115,8 +134,8 @@ class KnowledgeBase:
     def get_relevant_jobs(self, query: str, filters: Dict = None) -> List[Dict]:
         """Get relevant job listings based on query and filters."""
         matched_jobs = []
-        for job in self.job_listings.values():
-            if self._match_job(job, query, filters):
+        for job_id, job in self.job_listings.items():
+            if self._match_job(job, query, filters, self.job_search_text.get(job_id)):
                 # Enrich job data with women empowerment insights
                 job['women_friendly'] = self._check_women_friendly_company(job)
                 job['flexibility_score'] = self._calculate_flexibility_score(job)
@@ -127,19 +146,18 @@ class KnowledgeBase:
     def get_upcoming_events(self, category: str = None) -> List[Dict]:
         """Get upcoming events, optionally filtered by category."""
         now = datetime.now()
+        candidates = self.events_by_category.get(category.lower(), []) if category else self.events.values()
         events = [
-            event for event in self.events.values()
+            event for event in candidates
             if datetime.fromisoformat(event['date']) > now
-            and (not category or event['category'].lower() == category.lower())
         ]
         return sorted(events, key=lambda x: datetime.fromisoformat(x['date']))
 
     def get_mentorship_opportunities(self, expertise: str = None) -> List[Dict]:
         """Get mentorship opportunities, optionally filtered by expertise area."""
-        return [
-            program for program in self.mentorship_programs.values()
-            if not expertise or expertise.lower() in program['expertise_areas']
-        ]
+        if not expertise:
+            return list(self.mentorship_programs.values())
+        return list(self.mentorship_by_expertise.get(expertise.lower(), []))
 
     def _is_cache_valid(self, cache_file: Path) -> bool:
         """Check if cache is still valid based on TTL."""
@@ -265,18 +283,21 @@ class KnowledgeBase:
             
         return score
 
-    def _match_job(self, job: Dict, query: str, filters: Dict = None) -> bool:
+    def _match_job(self, job: Dict, query: str, filters: Dict = None, search_text: Optional[str] = None) -> bool:
         """Check if job matches search criteria."""
         if not filters:
             filters = {}
             
         # Basic text matching
         query_lower = query.lower()
-        text_match = (
-            query_lower in job['title'].lower() or
-            query_lower in job['description'].lower() or
-            any(query_lower in req.lower() for req in job['requirements'])
-        )
+        if search_text is not None and "\0" not in query_lower:
+            text_match = query_lower in search_text
+        else:
+            text_match = (
+                query_lower in job['title'].lower() or
+                query_lower in job['description'].lower() or
+                any(query_lower in req.lower() for req in job['requirements'])
+            )
         
         # Apply filters
         filter_match = all(
@@ -1,7 +1,9 @@
 import asyncio
 from typing import Dict, Optional
 from datetime import datetime
+from functools import cached_property
 import os
+import re
 from dotenv import load_dotenv
 import uuid
 
@@ -14,27 +16,77 @@ from core.error_handler import ErrorHandler, ErrorType
 from core.feedback_manager import FeedbackManager, FeedbackType
 
 class AshaAI:
+    # Free-text query keywords in priority order; the highest-priority group present wins
+    QUERY_KEYWORDS = (
+        ("job", ['job', 'career', 'work', 'position', 'opportunity']),
+        ("pd", ['develop', 'learn', 'skill', 'training', 'workshop']),
+        ("mentorship", ['mentor', 'guide', 'advice', 'coach']),
+        ("event", ['event', 'webinar', 'conference', 'meetup'])
+    )
+    
     def __init__(self):
         load_dotenv()
+        # Resolved once, after .env has been loaded
+        support_email = os.getenv("SUPPORT_EMAIL", "support@jobsforher.com")
+        self.support_suffix = f"\n\nFor immediate assistance, please contact our support team at {support_email}"
         self.context = ConversationContext()
         self.security = SecurityManager()
         self.knowledge_base = KnowledgeBase()
         self.current_menu = 'main'
+        self._turn_count = 0
+        # One start-anchored lookahead per keyword group, tried in priority order,
+        # so a single match names the highest-priority group present in the text
+        self.query_pattern = re.compile("|".join(
+            f"(?=.*?(?P<{group}>{'|'.join(map(re.escape, keywords))}))"
+            for group, keywords in self.QUERY_KEYWORDS
+        ), re.DOTALL)
+        self.query_handlers = {
+            "job": self._handle_job_query,
+            "pd": self._handle_pd_query,
+            "mentorship": self._handle_mentorship_query,
+            "event": self._handle_event_query
+        }
         self.load_session_data()
         
     def load_session_data(self):
-        """Load all data files"""
+        """Load the data files needed for menus; course and job data load on first use"""
         with open('data/session_details.json', 'r') as f:
             self.session_data = json.load(f)
             
+        with open('data/professional_development.json', 'r') as f:
+            self.pd_data = json.load(f)
+            
+        # Forget lazily loaded data so a reload rereads it on next access
+        self.__dict__.pop('course_data', None)
+        self.__dict__.pop('job_data', None)
+            
+        self._format_listings()
+        
+    @cached_property
+    def course_data(self) -> Dict:
+        """herShakti course catalogue, read on first access"""
         with open('data/hershakti_courses.json', 'r') as f:
-            self.course_data = json.load(f)
+            return json.load(f)
             
+    @cached_property
+    def job_data(self) -> Dict:
+        """Job listings, read on first access"""
         with open('data/job_listings.json', 'r') as f:
-            self.job_data = json.load(f)
-            
-        with open('data/professional_development.json', 'r') as f:
-            self.pd_data = json.load(f)
+            return json.load(f)
+        
+    def _format_listings(self):
+        """Pre-format static listings; call again whenever the data is reloaded"""
+        self.events_listing = "".join(
+            f"🎯 {event['title']}\n"
+            f"   📅 {event['date']}\n"
+            f"   📍 {event['location']}\n"
+            f"   ℹ️ {event['description']}\n\n"
+            for event in self.session_data['events']
+        )
+        self.workshops_preview = "".join(
+            f"   • {workshop['title']} - {workshop['date']}\n"
+            for workshop in self.pd_data['workshops'][:2]
+        )
             
     def get_main_menu(self) -> str:
         """Return the main menu options"""
@@ -114,8 +166,11 @@ Enter your choice (1-4) or 'back' to return:"""
         start_time = datetime.now()
         response_id = str(uuid.uuid4())
         
+        # Lowercase once and share it with the menu check, bias scan and router
+        input_lower = user_input.lower()
+        
         # Store current input for context
-        self.last_input = user_input.lower().strip()
+        self.last_input = input_lower.strip()
         
         # Store last topic for context
         if hasattr(self, 'last_topic') and self.last_input in ['yes', 'y']:
@@ -127,7 +182,7 @@ Enter your choice (1-4) or 'back' to return:"""
         
         try:
             # Handle menu navigation
-            if user_input.lower() in ['main menu', 'back', 'home']:
+            if input_lower in ['main menu', 'back', 'home']:
                 self.current_menu = 'main'
                 return {"text": self.get_main_menu(), "response_id": response_id}
                 
@@ -257,7 +312,7 @@ Enter your choice (1-4) or 'back' to return:"""
         
         try:
             # Check for bias in input
-            bias_type, confidence, suggestion = self.bias_detector.detect_bias(user_input)
+            bias_type, confidence, suggestion = self.bias_detector.detect_bias(user_input, input_lower)
             if bias_type != "none" and confidence > 0.7:
                 self.analytics.track_bias_incident(user_input, bias_type, confidence)
                 self.feedback_manager.report_bias(user_input, "user_input")
@@ -271,12 +326,12 @@ Enter your choice (1-4) or 'back' to return:"""
             self.context.add_message("user", user_input)
             
             # Generate response based on context
-            response = await self._generate_response(user_input)
+            response = await self._generate_response(user_input, input_lower)
             response["response_id"] = response_id
             
             # Check response for bias
-            if self.bias_detector.check_response_bias(response["text"]):
-                alternative = self.bias_detector.get_inclusive_alternative(response["text"])
+            alternative = self.bias_detector.get_response_alternative(response["text"])
+            if alternative is not None:
                 self.feedback_manager.report_bias(response["text"], "bot_response")
                 response["text"] = alternative
                 
@@ -286,6 +341,7 @@ Enter your choice (1-4) or 'back' to return:"""
             
             # Add response to context
             self.context.add_message("assistant", response["text"])
+            self._turn_count += 1
             
             # Mark for feedback if needed
             response["requires_feedback"] = self._should_request_feedback()
@@ -316,23 +372,15 @@ Enter your choice (1-4) or 'back' to return:"""
                 "requires_feedback": True
             }
             
-    async def _generate_response(self, user_input: str) -> Dict:
+    async def _generate_response(self, user_input: str, input_lower: Optional[str] = None) -> Dict:
         """Generate appropriate response based on user input."""
-        # Handle job-related queries
-        if any(word in user_input.lower() for word in ['job', 'career', 'work', 'position', 'opportunity']):
-            return self._handle_job_query(user_input)
-            
-        # Handle professional development queries
-        elif any(word in user_input.lower() for word in ['develop', 'learn', 'skill', 'training', 'workshop']):
-            return self._handle_pd_query(user_input)
-            
-        # Handle mentorship queries
-        elif any(word in user_input.lower() for word in ['mentor', 'guide', 'advice', 'coach']):
-            return self._handle_mentorship_query(user_input)
-            
-        # Handle event queries
-        elif any(word in user_input.lower() for word in ['event', 'webinar', 'conference', 'meetup']):
-            return self._handle_event_query(user_input)
+        if input_lower is None:
+            input_lower = user_input.lower()
+        
+        # Route job, development, mentorship and event queries from one keyword scan
+        match = self.query_pattern.match(input_lower)
+        if match:
+            return self.query_handlers[match.lastgroup](user_input)
             
         return {
             "text": "I'm here to help you with:
@@ -619,8 +667,7 @@ What would you like to explore?",
         
         # Upcoming Workshops
         response += "📒 4. Upcoming Workshops & Events\n"
-        for workshop in self.pd_data['workshops'][:2]:
-            response += f"   • {workshop['title']} - {workshop['date']}\n"
+        response += self.workshops_preview
         response += "\n"
         
         # Resources
@@ -632,25 +679,6 @@ What would you like to explore?",
         response += "Select a number (1-5) to learn more about any program."
         return {"text": response}
         
-        for key, program in programs.items():
-            response += f"📚 {program['title']}\n"
-            response += f"   ⏱️ Duration: {program['duration']}\n"
-            response += f"   📍 Format: {program['format']}\n"
-            response += f"   ✨ Key Benefits: {', '.join(program['benefits'][:2])}\n\n"
-            
-        response += "\nUpcoming Workshops:\n"
-        for workshop in self.pd_data['workshops']:
-            response += f"🗓️ {workshop['title']} - {workshop['date']}\n"
-            
-        response += "\nWhat interests you?\n"
-        response += "1. Leadership Development\n"
-        response += "2. Technical Skills\n"
-        response += "3. Entrepreneurship\n"
-        response += "4. View all workshops\n"
-        response += "5. Download resource toolkit"
-        
-        return {"text": response, "data": {"programs": programs}}
-        
     def _handle_mentorship_query(self, query: str) -> Dict:
         """Handle mentorship queries"""
         self.current_menu = 'mentorship'
@@ -685,12 +713,7 @@ What would you like to explore?",
         self.current_menu = 'events'
         events = self.session_data['events']
         response = "📅 Upcoming Events:\n\n"
-        
-        for event in events:
-            response += f"🎯 {event['title']}\n"
-            response += f"   📅 {event['date']}\n"
-            response += f"   📍 {event['location']}\n"
-            response += f"   ℹ️ {event['description']}\n\n"
+        response += self.events_listing
             
         response += "What would you like to do?\n"
         response += "1. Register for an event\n"
@@ -731,13 +754,11 @@ What would you like to explore?",
     def _should_request_feedback(self) -> bool:
         """Determine if we should request feedback for this interaction."""
         # Request feedback every 5 interactions or after potential issues
-        interactions = len(self.context.conversation_history)
-        return interactions % 5 == 0 or interactions <= 2
+        return self._turn_count % 5 == 0 or self._turn_count <= 2
         
     def _get_human_support_message(self, fallback_msg: str) -> str:
         """Generate message for human support redirection."""
-        support_email = os.getenv("SUPPORT_EMAIL", "support@jobsforher.com")
-        return f"{fallback_msg}\n\nFor immediate assistance, please contact our support team at {support_email}"
+        return fallback_msg + self.support_suffix
         
     def save_analytics(self):
         """Save analytics and feedback data."""
@@ -793,21 +814,20 @@ What would you like to explore?",
         if not program:
             return {"text": "Program details not found."}
             
-        response = f"📚 {program['title']}\n\n"
-        response += f"Duration: {program['duration']}\n"
-        response += f"Format: {program['format']}\n\n"
-        
-        response += "Modules:\n"
+        lines = [
+            f"📚 {program['title']}\n",
+            f"Duration: {program['duration']}",
+            f"Format: {program['format']}\n",
+            "Modules:"
+        ]
         for module in program['modules']:
-            response += f"\n{module['title']}:\n"
-            for topic in module['topics']:
-                response += f"  • {topic}\n"
-                
-        response += "\nBenefits:\n"
-        for benefit in program['benefits']:
-            response += f"  • {benefit}\n"
+            lines.append(f"\n{module['title']}:")
+            lines.extend(f"  • {topic}" for topic in module['topics'])
             
-        return {"text": response}
+        lines.append("\nBenefits:")
+        lines.extend(f"  • {benefit}" for benefit in program['benefits'])
+            
+        return {"text": "\n".join(lines) + "\n"}
 
     def _show_all_workshops(self) -> Dict:
         """Show all upcoming workshops"""
@@ -2,10 +2,11 @@ from typing import Dict, List, Optional
 import logging
 from enum import Enum
 import re
+import time
+from collections import Counter
+from bisect import bisect_right
 from datetime import datetime
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class BiasType(Enum):
@@ -25,12 +26,15 @@ class BiasSeverity(Enum):
     CRITICAL = "critical"
 
 class BiasIncident:
+    __slots__ = ('bias_type', 'severity', 'text', 'context', 'timestamp', 'mitigation_actions')
+
     def __init__(self, bias_type: BiasType, severity: BiasSeverity, text: str, context: Dict):
         self.bias_type = bias_type
         self.severity = severity
         self.text = text
         self.context = context
-        self.timestamp = datetime.now()
+        # Epoch seconds; converted to ISO format only when serialized
+        self.timestamp = time.time()
         self.mitigation_actions = []
 
     def add_mitigation_action(self, action: str):
@@ -42,50 +46,55 @@ class BiasIncident:
             "severity": self.severity.value,
             "text": self.text,
             "context": self.context,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
             "mitigation_actions": self.mitigation_actions
         }
 
 class BiasDetector:
     def __init__(self):
-        # Initialize bias detection patterns
-        self.bias_patterns = {
-            BiasType.GENDER: [
-                r'\b(he|she|him|her|his|hers)\b',
-                r'\b(man|woman|boy|girl)\b',
-                r'\b(male|female)\b',
-                r'\b(gentleman|lady)\b'
-            ],
-            BiasType.AGE: [
-                r'\b(old|young|elderly|senior|junior)\b',
-                r'\b(age|aged)\b',
-                r'\b(millennial|gen z|boomer)\b'
-            ],
-            BiasType.RACE: [
-                r'\b(black|white|asian|hispanic)\b',
-                r'\b(race|racial)\b',
-                r'\b(ethnicity|ethnic)\b'
-            ],
-            BiasType.RELIGION: [
-                r'\b(christian|muslim|hindu|jew|buddhist)\b',
-                r'\b(religion|religious)\b',
-                r'\b(faith|belief)\b'
-            ],
-            BiasType.DISABILITY: [
-                r'\b(disabled|handicapped|impaired)\b',
-                r'\b(able-bodied|normal)\b',
-                r'\b(special needs)\b'
-            ]
+        # Initialize bias detection vocabularies: single words are matched
+        # against the tokenized text, multi-word phrases via regex
+        self.bias_words = {
+            BiasType.GENDER: frozenset({
+                'he', 'she', 'him', 'her', 'his', 'hers',
+                'man', 'woman', 'boy', 'girl',
+                'male', 'female',
+                'gentleman', 'lady'
+            }),
+            BiasType.AGE: frozenset({
+                'old', 'young', 'elderly', 'senior', 'junior',
+                'age', 'aged',
+                'millennial', 'boomer'
+            }),
+            BiasType.RACE: frozenset({
+                'black', 'white', 'asian', 'hispanic',
+                'race', 'racial',
+                'ethnicity', 'ethnic'
+            }),
+            BiasType.RELIGION: frozenset({
+                'christian', 'muslim', 'hindu', 'jew', 'buddhist',
+                'religion', 'religious',
+                'faith', 'belief'
+            }),
+            BiasType.DISABILITY: frozenset({
+                'disabled', 'handicapped', 'impaired',
+                'normal'
+            })
         }
-
-        # Initialize severity thresholds
-        self.severity_thresholds = {
-            BiasSeverity.LOW: 1,
-            BiasSeverity.MEDIUM: 3,
-            BiasSeverity.HIGH: 5,
-            BiasSeverity.CRITICAL: 7
+        self.bias_phrases = {
+            BiasType.AGE: re.compile(r'\b(gen z)\b'),
+            BiasType.DISABILITY: re.compile(r'\b(able-bodied|special needs)\b')
         }
 
+        # Initialize severity thresholds, ordered to match severity_levels
+        self.severity_thresholds = (1, 3, 5, 7)
+        self.severity_levels = (
+            BiasSeverity.LOW,
+            BiasSeverity.MEDIUM,
+            BiasSeverity.HIGH,
+            BiasSeverity.CRITICAL
+        )
+
     def detect_bias(self, text: str, context: Optional[Dict] = None) -> List[BiasIncident]:
         """
         Detect potential bias in the given text.
@@ -99,14 +108,17 @@ class BiasDetector:
         """
         incidents = []
         context = context or {}
+        text_lower = text.lower()
+        tokens = Counter(re.findall(r'\w+', text_lower))
 
-        for bias_type, patterns in self.bias_patterns.items():
-            matches = []
-            for pattern in patterns:
-                matches.extend(re.finditer(pattern, text.lower()))
+        for bias_type, words in self.bias_words.items():
+            match_count = sum(tokens[word] for word in words & tokens.keys())
+            phrase_pattern = self.bias_phrases.get(bias_type)
+            if phrase_pattern:
+                match_count += len(phrase_pattern.findall(text_lower))
 
-            if matches:
-                severity = self._determine_severity(len(matches))
+            if match_count:
+                severity = self._determine_severity(match_count)
                 incident = BiasIncident(
                     bias_type=bias_type,
                     severity=severity,
@@ -121,14 +133,8 @@ class BiasDetector:
         """
         Determine the severity level based on the number of matches.
         """
-        if match_count >= self.severity_thresholds[BiasSeverity.CRITICAL]:
-            return BiasSeverity.CRITICAL
-        elif match_count >= self.severity_thresholds[BiasSeverity.HIGH]:
-            return BiasSeverity.HIGH
-        elif match_count >= self.severity_thresholds[BiasSeverity.MEDIUM]:
-            return BiasSeverity.MEDIUM
-        else:
-            return BiasSeverity.LOW
+        index = bisect_right(self.severity_thresholds, match_count) - 1
+        return self.severity_levels[max(index, 0)]
 
     def get_mitigation_suggestions(self, incident: BiasIncident) -> List[str]:
         """
@@ -173,4 +179,5 @@ class BiasDetector:
         """
         Log the bias incident for monitoring and analysis.
         """
-        logger.warning(f"Bias incident detected: {incident.to_dict()}") 
\ No newline at end of file
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Bias incident detected: %s", incident.to_dict()) 
\ No newline at end of file
@@ -1,9 +1,13 @@
-import json
 import logging
+import orjson
 from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime, timedelta
 import os
-import uuid
+import re
+import time
+import secrets
+from collections import deque
+from functools import cached_property, lru_cache
 from dotenv import load_dotenv
 
 # Configure logging
@@ -13,51 +17,141 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Mock data for events
+MOCK_EVENTS = [
+    {
+        "title": "Women in Tech Conference 2025",
+        "date": "2025-06-15",
+        "description": "Annual conference featuring women leaders in technology"
+    },
+    {
+        "title": "Career Development Workshop",
+        "date": "2025-05-01",
+        "description": "Interactive workshop on career growth and leadership"
+    }
+]
+
+# Mock data for professional development programs
+MOCK_PROFESSIONAL_DEVELOPMENT = [
+    {
+        "title": "Leadership Excellence Program",
+        "type": "leadership",
+        "description": "Comprehensive leadership training for aspiring managers"
+    },
+    {
+        "title": "Technical Skills Bootcamp",
+        "type": "technical",
+        "description": "Intensive technical training in modern technologies"
+    }
+]
+
+# Mock data for mentorship programs
+MOCK_MENTORSHIP_PROGRAMS = [
+    {
+        "name": "Women in Leadership Mentorship",
+        "description": "6-month program for aspiring women leaders",
+        "duration": "6 months",
+        "format": "Virtual sessions with industry leaders"
+    },
+    {
+        "name": "Tech Career Acceleration",
+        "description": "4-month tech mentorship program",
+        "duration": "4 months",
+        "format": "Weekly 1:1 sessions with tech leaders"
+    }
+]
+
 class SessionManager:
-    def __init__(self):
+    def __init__(self, session_ttl: float = 1800, sweep_interval: float = 60):
+        # Session state is kept column-wise: one dict per field, keyed by session_id
         self.sessions = {}
         self.history = {}
         self.context = {}
+        self.last_active = {}
+        self.max_history = 10
+        # Sessions idle for longer than this many seconds are dropped, checked
+        # at most once per sweep_interval so create_session stays cheap
+        self.session_ttl = session_ttl
+        self.sweep_interval = sweep_interval
+        self._last_sweep = time.monotonic()
     
-    def create_session(self, user_id: str) -> str:
-        session_id = str(uuid.uuid4())
+    def create_session(self, user_id: str, now: Optional[float] = None) -> str:
+        if now is None:
+            now = time.time()
+        # Sweep idle sessions as new ones arrive so abandoned ones don't pile up
+        sweep_at = time.monotonic()
+        if sweep_at - self._last_sweep >= self.sweep_interval:
+            self._last_sweep = sweep_at
+            self.expire_sessions(self.session_ttl, now)
+        session_id = secrets.token_hex(16)
         self.sessions[session_id] = user_id
-        self.history[session_id] = []
+        self.history[session_id] = deque(maxlen=self.max_history)
         self.context[session_id] = {}
+        self.last_active[session_id] = now
         return session_id
     
+    def touch(self, session_id: str, now: Optional[float] = None):
+        if session_id in self.last_active:
+            self.last_active[session_id] = now if now is not None else time.time()
+    
+    def expire_sessions(self, ttl_seconds: float, now: Optional[float] = None) -> int:
+        """Drop sessions idle for longer than ttl_seconds and return how many were removed"""
+        cutoff = (now if now is not None else time.time()) - ttl_seconds
+        expired = [sid for sid, seen in self.last_active.items() if seen < cutoff]
+        for column in (self.sessions, self.history, self.context, self.last_active):
+            for sid in expired:
+                column.pop(sid, None)
+        return len(expired)
+    
     def get_context(self, session_id: str) -> Dict:
         return self.context.get(session_id, {})
     
     def update_context(self, session_id: str, updates: Dict):
-        if session_id in self.context:
-            self.context[session_id].update(updates)
+        context = self.context.get(session_id)
+        if context is not None:
+            context.update(updates)
     
-    def add_to_history(self, session_id: str, user_message: str, bot_response: str):
-        if session_id in self.history:
-            self.history[session_id].append({
+    def add_to_history(self, session_id: str, user_message: str, bot_response: str, now: Optional[float] = None):
+        history = self.history.get(session_id)
+        if history is not None:
+            history.append({
                 'user': user_message,
                 'bot': bot_response,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': (datetime.fromtimestamp(now) if now is not None else datetime.now()).isoformat()
             })
 
 class NLPProcessor:
+    # Intent keywords in priority order; the first intent with a match wins
+    INTENT_KEYWORDS = (
+        ("events", ['event', 'workshop', 'conference']),
+        ("professional_development", ['course', 'training', 'program', 'development']),
+        ("mentorship", ['mentor', 'mentorship', 'guidance'])
+    )
+    # One lookahead branch per intent, anchored at the start of the text.
+    # Branches are tried in priority order, so the first branch whose
+    # keywords occur anywhere in the text decides the intent in one match.
+    # Compiled once with the class and shared by every instance
+    intent_pattern = re.compile("|".join(
+        f"(?=.*?(?P<{intent}>{'|'.join(map(re.escape, keywords))}))"
+        for intent, keywords in INTENT_KEYWORDS
+    ), re.DOTALL)
+
     def __init__(self):
-        pass
+        # Keyed on the message as received, so repeats skip both the lowercase
+        # copy and the scan; only the immutable intent name is cached
+        self._detect_intent = lru_cache(maxsize=1024)(self._scan_intent)
     
     def normalize_text(self, text: str) -> str:
         return text.strip()
     
     def process_text(self, text: str) -> Dict:
+        # Build a fresh dict per call since handlers add keys to intent_data
+        return {"intent": self._detect_intent(text), "entities": {}}
+    
+    def _scan_intent(self, text: str) -> str:
         # Simple intent detection based on keywords
-        text = text.lower()
-        if any(word in text for word in ['event', 'workshop', 'conference']):
-            return {"intent": "events", "entities": {}}
-        elif any(word in text for word in ['course', 'training', 'program', 'development']):
-            return {"intent": "professional_development", "entities": {}}
-        elif any(word in text for word in ['mentor', 'mentorship', 'guidance']):
-            return {"intent": "mentorship", "entities": {}}
-        return {"intent": "general", "entities": {}}
+        match = self.intent_pattern.match(text.lower())
+        return match.lastgroup if match else "general"
 
 class HinglishProcessor:
     def detect_hinglish(self, text: str) -> bool:
@@ -79,66 +173,31 @@ class DataManager:
         self.events = []
         self.professional_development = []
         self.data_path = os.path.join(os.path.dirname(__file__), 'data')
+        # Bumped on every load so cached renderings of older data are never reused
+        self.version = 0
     
     def load_data(self):
+        self.version += 1
         # Load events data
         events_path = os.path.join(self.data_path, 'events.json')
         if os.path.exists(events_path):
-            with open(events_path, 'r') as f:
-                self.events = json.load(f)
+            with open(events_path, 'rb') as f:
+                self.events = orjson.loads(f.read())
         
         # Load professional development data
         pd_path = os.path.join(self.data_path, 'professional_development.json')
         if os.path.exists(pd_path):
-            with open(pd_path, 'r') as f:
-                self.professional_development = json.load(f)
+            with open(pd_path, 'rb') as f:
+                self.professional_development = orjson.loads(f.read())
     
     def get_events(self, filters: Dict = None) -> List[Dict]:
-        # Mock data for events
-        return [
-            {
-                "title": "Women in Tech Conference 2025",
-                "date": "2025-06-15",
-                "description": "Annual conference featuring women leaders in technology"
-            },
-            {
-                "title": "Career Development Workshop",
-                "date": "2025-05-01",
-                "description": "Interactive workshop on career growth and leadership"
-            }
-        ]
+        return MOCK_EVENTS
     
     def get_professional_development(self, filters: Dict = None) -> List[Dict]:
-        # Mock data for professional development programs
-        return [
-            {
-                "title": "Leadership Excellence Program",
-                "type": "leadership",
-                "description": "Comprehensive leadership training for aspiring managers"
-            },
-            {
-                "title": "Technical Skills Bootcamp",
-                "type": "technical",
-                "description": "Intensive technical training in modern technologies"
-            }
-        ]
+        return MOCK_PROFESSIONAL_DEVELOPMENT
     
     def get_mentorship_programs(self, filters: Dict = None) -> List[Dict]:
-        # Mock data for mentorship programs
-        return [
-            {
-                "name": "Women in Leadership Mentorship",
-                "description": "6-month program for aspiring women leaders",
-                "duration": "6 months",
-                "format": "Virtual sessions with industry leaders"
-            },
-            {
-                "name": "Tech Career Acceleration",
-                "description": "4-month tech mentorship program",
-                "duration": "4 months",
-                "format": "Weekly 1:1 sessions with tech leaders"
-            }
-        ]
+        return MOCK_MENTORSHIP_PROGRAMS
 
 class SecurityManager:
     def authenticate_user(self, username: str, password: str) -> bool:
@@ -160,18 +219,50 @@ class AshaAI:
     def __init__(self):
         self.session_manager = SessionManager()
         self.data_manager = DataManager()
-        self.nlp = NLPProcessor()
-        self.hinglish_processor = HinglishProcessor()
-        self.bias_detector = BiasDetector()
-        self.sentiment_analyzer = SentimentAnalyzer()
-        self.security_manager = SecurityManager()
-        self.error_handler = ErrorHandler()
+        # Intent dispatch table; anything unlisted falls through to the general handler
+        self.intent_handlers = {
+            "events": self._handle_events,
+            "professional_development": self._handle_professional_development,
+            "mentorship": self._handle_mentorship_query
+        }
+        # Rendered listing text keyed by (intent, entities, data version)
+        self.listing_cache: Dict[Tuple, str] = {}
+        self.listing_cache_size = 1024
+    
+    # Stateless helpers are built on first use, so instances that never
+    # process a message (or never authenticate) do not pay for them
+    @cached_property
+    def nlp(self) -> NLPProcessor:
+        return NLPProcessor()
+    
+    @cached_property
+    def hinglish_processor(self) -> HinglishProcessor:
+        return HinglishProcessor()
+    
+    @cached_property
+    def bias_detector(self) -> BiasDetector:
+        return BiasDetector()
+    
+    @cached_property
+    def sentiment_analyzer(self) -> SentimentAnalyzer:
+        return SentimentAnalyzer()
+    
+    @cached_property
+    def security_manager(self) -> SecurityManager:
+        return SecurityManager()
+    
+    @cached_property
+    def error_handler(self) -> ErrorHandler:
+        return ErrorHandler()
     
     def process_message(self, message: str, session_id: Optional[str] = None) -> Dict[str, Any]:
         try:
+            # Read the clock once per turn and share it across session bookkeeping
+            now = time.time()
+            
             # Create session if not exists
             if not session_id:
-                session_id = self.session_manager.create_session("anonymous")
+                session_id = self.session_manager.create_session("anonymous", now)
             
             # Check for Hinglish content
             if self.hinglish_processor.detect_hinglish(message):
@@ -195,25 +286,18 @@ class AshaAI:
             sentiment = self.sentiment_analyzer.analyze_sentiment(message)
             
             # Handle intent
-            if intent == "events":
-                # Add current date to intent data for event filtering
-                intent_data["current_date"] = "2025-04-28"  # Using the provided current time
-                response = self._handle_events(intent_data, session_id)
-            elif intent == "professional_development":
-                response = self._handle_professional_development(intent_data, session_id)
-            elif intent == "mentorship":
-                response = self._handle_mentorship_query(intent_data, session_id)
-            else:
-                response = self._handle_general_query(intent_data, session_id)
+            handler = self.intent_handlers.get(intent, self._handle_general_query)
+            response = handler(intent_data, session_id)
             
             # Update session context
+            self.session_manager.touch(session_id, now)
             self.session_manager.update_context(session_id, {
                 "last_intent": intent,
                 "last_sentiment": sentiment
             })
             
             # Add to conversation history
-            self.session_manager.add_to_history(session_id, message, response["text"])
+            self.session_manager.add_to_history(session_id, message, response["text"], now)
             
             return response
             
@@ -226,23 +310,16 @@ class AshaAI:
     
     def _handle_events(self, intent_data: Dict[str, Any], session_id: str) -> Dict[str, Any]:
         try:
-            events = self.data_manager.get_events(intent_data)
+            # Add current date to intent data for event filtering
+            intent_data["current_date"] = "2025-04-28"  # Using the provided current time
+            response = self._cached_listing(intent_data, self._format_events)
             
-            if not events:
+            if response is None:
                 return {
                     "text": "I couldn't find any upcoming events. Would you like to explore professional development programs instead?",
                     "action": None
                 }
             
-            # Format response
-            response = "Here are some upcoming events that might interest you:\n\n"
-            for event in events:
-                response += f"- {event['title']}\n"
-                response += f"  Date: {event['date']}\n"
-                response += f"  Description: {event['description']}\n\n"
-            
-            response += "\nWould you like more details about any of these events?"
-            
             return {
                 "text": response,
                 "action": None
@@ -257,23 +334,14 @@ class AshaAI:
     
     def _handle_professional_development(self, intent_data: Dict[str, Any], session_id: str) -> Dict[str, Any]:
         try:
-            programs = self.data_manager.get_professional_development(intent_data)
+            response = self._cached_listing(intent_data, self._format_professional_development)
             
-            if not programs:
+            if response is None:
                 return {
                     "text": "I couldn't find any professional development programs matching your criteria. Would you like to explore other opportunities?",
                     "action": None
                 }
             
-            # Format response
-            response = "Here are some professional development programs that might interest you:\n\n"
-            for program in programs:
-                response += f"- {program['title']}\n"
-                response += f"  Type: {program['type']}\n"
-                response += f"  Description: {program['description']}\n\n"
-            
-            response += "\nWould you like more details about any of these programs?"
-            
             return {
                 "text": response,
                 "action": None
@@ -295,25 +363,14 @@ class AshaAI:
     def _handle_mentorship_query(self, intent_data: Dict[str, Any], session_id: str) -> Dict[str, Any]:
         """Handle mentorship related queries."""
         try:
-            entities = intent_data.get("entities", {})
-            mentorship_programs = self.data_manager.get_mentorship_programs(entities)
+            response = self._cached_listing(intent_data, self._format_mentorship_programs)
             
-            if not mentorship_programs:
+            if response is None:
                 return {
                     "text": "I couldn't find any mentorship programs matching your criteria. Would you like to explore other professional development opportunities?",
                     "action": None
                 }
             
-            # Format response
-            response = "Here are some mentorship programs that might interest you:\n\n"
-            for program in mentorship_programs:
-                response += f"- {program['name']}\n"
-                response += f"  Duration: {program['duration']}\n"
-                response += f"  Format: {program['format']}\n"
-                response += f"  Description: {program['description']}\n\n"
-            
-            response += "\nWould you like more details about any of these programs?"
-            
             return {
                 "text": response,
                 "action": None
@@ -325,6 +382,65 @@ class AshaAI:
                 "text": "I apologize, but I encountered an error retrieving mentorship programs. Please try again.",
                 "action": None
             }
+    
+    def _cached_listing(self, intent_data: Dict[str, Any], build) -> Optional[str]:
+        """Return build(intent_data), reusing earlier text for the same intent, entities and data"""
+        try:
+            key = (
+                intent_data.get("intent"),
+                frozenset(intent_data.get("entities", {}).items()),
+                self.data_manager.version
+            )
+        except TypeError:
+            # Unhashable entity values; render without caching
+            return build(intent_data)
+        
+        if key in self.listing_cache:
+            return self.listing_cache[key]
+        
+        # Exceptions from build propagate to the handler and are never cached
+        text = build(intent_data)
+        if len(self.listing_cache) >= self.listing_cache_size:
+            self.listing_cache.pop(next(iter(self.listing_cache)))
+        self.listing_cache[key] = text
+        return text
+    
+    @staticmethod
+    def _format_listing(items: List[Dict], subject: str, name_field: str, detail_fields: Tuple[str, ...], noun: str) -> str:
+        """Render items as a bulleted list with one indented line per detail field"""
+        parts = [f"Here are some {subject} that might interest you:\n\n"]
+        # Bind the list methods once instead of looking them up per item
+        append, extend = parts.append, parts.extend
+        labels = [(field, field.title()) for field in detail_fields]
+        for item in items:
+            append(f"- {item[name_field]}\n")
+            extend([f"  {label}: {item[field]}\n" for field, label in labels])
+            append("\n")
+        parts.append(f"\nWould you like more details about any of these {noun}?")
+        return "".join(parts)
+    
+    def _format_events(self, intent_data: Dict[str, Any]) -> Optional[str]:
+        events = self.data_manager.get_events(intent_data)
+        if not events:
+            return None
+        return self._format_listing(events, "upcoming events", "title", ("date", "description"), "events")
+    
+    def _format_professional_development(self, intent_data: Dict[str, Any]) -> Optional[str]:
+        programs = self.data_manager.get_professional_development(intent_data)
+        if not programs:
+            return None
+        return self._format_listing(
+            programs, "professional development programs", "title", ("type", "description"), "programs"
+        )
+    
+    def _format_mentorship_programs(self, intent_data: Dict[str, Any]) -> Optional[str]:
+        entities = intent_data.get("entities", {})
+        mentorship_programs = self.data_manager.get_mentorship_programs(entities)
+        if not mentorship_programs:
+            return None
+        return self._format_listing(
+            mentorship_programs, "mentorship programs", "name", ("duration", "format", "description"), "programs"
+        )
 
 def main():
     try:
@@ -1,14 +1,81 @@
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import json
+import orjson
 import os
+import atexit
+import heapq
+from contextlib import contextmanager
 from dataclasses import dataclass
 import logging
 from collections import deque
 
+try:
+    import fcntl
+except ImportError:  # Windows: memory files are only safe for one process there
+    fcntl = None
+
+# Number of messages a conversation context keeps by default
+DEFAULT_CONTEXT_WINDOW = 10
+
+logger = logging.getLogger(__name__)
+
+@contextmanager
+def _memory_files_lock(exclusive: bool = False):
+    """Lock memory.json/memory.log against compaction by other instances or processes"""
+    os.makedirs('data', exist_ok=True)
+    with open('data/memory.lock', 'ab') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        # Closing the file releases the lock
+        yield
+
+def _compact_memory_log():
+    """Fold memory.log into memory.json and remove the log"""
+    if not os.path.exists('data/memory.log'):
+        return
+    try:
+        with _memory_files_lock(exclusive=True):
+            if not os.path.exists('data/memory.log'):
+                return
+            memory_data = {}
+            if os.path.exists('data/memory.json'):
+                with open('data/memory.json', 'rb') as f:
+                    memory_data = orjson.loads(f.read())
+            
+            # Replay every logged change, whichever instance wrote it; later entries win
+            with open('data/memory.log', 'rb') as f:
+                for line in f:
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # Partial line from an interrupted write
+                        continue
+                    key = entry.pop('key')
+                    if entry.get('deleted'):
+                        memory_data.pop(key, None)
+                    else:
+                        memory_data[key] = entry
+            
+            # Write to a temporary file first so a crash never leaves a truncated memory.json
+            with open('data/memory.json.tmp', 'wb') as f:
+                f.write(orjson.dumps(memory_data, option=orjson.OPT_INDENT_2))
+            os.replace('data/memory.json.tmp', 'data/memory.json')
+            os.remove('data/memory.log')
+    except Exception as e:
+        logger.error(f"Error saving memory: {str(e)}")
+
+# Fold outstanding memory changes into memory.json on interpreter exit
+atexit.register(_compact_memory_log)
+
 @dataclass
 class ConversationContext:
     """Represents the context of a conversation"""
+    # Explicit __slots__ (dataclass(slots=True) needs Python 3.10); slotted
+    # fields can't carry class-level defaults, so every field is required
+    __slots__ = (
+        'session_id', 'user_id', 'current_topic', 'previous_topics', 'entities',
+        'preferences', 'last_interaction', 'conversation_history', 'context_window'
+    )
     session_id: str
     user_id: str
     current_topic: str
@@ -16,12 +83,15 @@ class ConversationContext:
     entities: Dict[str, List[str]]
     preferences: Dict[str, Any]
     last_interaction: datetime
-    conversation_history: List[Dict[str, str]]
-    context_window: int = 10  # Number of messages to keep in memory
+    conversation_history: Deque[Dict[str, str]]  # bounded to context_window
+    context_window: int  # Number of messages to keep in memory
 
 @dataclass
 class MemoryItem:
     """Represents a long-term memory item"""
+    # search_text is a slot but not a dataclass field, so it stays out of
+    # __init__, repr and comparisons
+    __slots__ = ('key', 'value', 'timestamp', 'importance', 'category', 'metadata', 'search_text')
     key: str
     value: Any
     timestamp: datetime
@@ -29,55 +99,97 @@ class MemoryItem:
     category: str
     metadata: Dict[str, Any]
 
+    def __post_init__(self):
+        # Lowercased value text, computed once for retrieve_memory matching
+        self.search_text = str(self.value).lower()
+
 class ContextManager:
-    def __init__(self, max_memory_items: int = 1000, memory_retention_days: int = 30):
+    def __init__(self, max_memory_items: int = 1000, memory_retention_days: int = 30, compact_after: int = 500):
         self.contexts: Dict[str, ConversationContext] = {}
         self.long_term_memory: Dict[str, MemoryItem] = {}
         self.max_memory_items = max_memory_items
         self.memory_retention_days = memory_retention_days
         self.logger = logging.getLogger(__name__)
+        # Memory changes are appended to memory.log; memory.json is only
+        # rewritten once compact_after changes have accumulated
+        self.compact_after = compact_after
+        self._log_entries = 0
         
         # Load existing memory if available
         self._load_memory()
     
+    @staticmethod
+    def _memory_to_record(item: MemoryItem) -> Dict[str, Any]:
+        """Serializable form of a memory item"""
+        return {
+            'value': item.value,
+            'timestamp': item.timestamp.isoformat(),
+            'importance': item.importance,
+            'category': item.category,
+            'metadata': item.metadata
+        }
+    
+    @staticmethod
+    def _memory_from_record(key: str, item: Dict[str, Any]) -> MemoryItem:
+        """Rebuild a memory item from its serialized form"""
+        return MemoryItem(
+            key=key,
+            value=item['value'],
+            timestamp=datetime.fromisoformat(item['timestamp']),
+            importance=item['importance'],
+            category=item['category'],
+            metadata=item['metadata']
+        )
+    
     def _load_memory(self):
         """Load long-term memory from file"""
         try:
-            if os.path.exists('data/memory.json'):
-                with open('data/memory.json', 'r') as f:
-                    memory_data = json.load(f)
-                    for key, item in memory_data.items():
-                        self.long_term_memory[key] = MemoryItem(
-                            key=key,
-                            value=item['value'],
-                            timestamp=datetime.fromisoformat(item['timestamp']),
-                            importance=item['importance'],
-                            category=item['category'],
-                            metadata=item['metadata']
-                        )
+            with _memory_files_lock():
+                if os.path.exists('data/memory.json'):
+                    with open('data/memory.json', 'rb') as f:
+                        memory_data = orjson.loads(f.read())
+                        for key, item in memory_data.items():
+                            self.long_term_memory[key] = self._memory_from_record(key, item)
+                
+                # Replay changes made since the last snapshot; later entries win
+                if os.path.exists('data/memory.log'):
+                    with open('data/memory.log', 'rb') as f:
+                        for line in f:
+                            try:
+                                entry = orjson.loads(line)
+                            except orjson.JSONDecodeError:
+                                # Partial line from an interrupted write
+                                continue
+                            if entry.get('deleted'):
+                                self.long_term_memory.pop(entry['key'], None)
+                            else:
+                                self.long_term_memory[entry['key']] = self._memory_from_record(entry['key'], entry)
+                            self._log_entries += 1
         except Exception as e:
             self.logger.error(f"Error loading memory: {str(e)}")
     
-    def _save_memory(self):
-        """Save long-term memory to file"""
+    def _append_to_log(self, entries: List[Dict[str, Any]]):
+        """Append memory changes to memory.log, compacting once it grows large"""
         try:
-            os.makedirs('data', exist_ok=True)
-            memory_data = {
-                key: {
-                    'value': item.value,
-                    'timestamp': item.timestamp.isoformat(),
-                    'importance': item.importance,
-                    'category': item.category,
-                    'metadata': item.metadata
-                }
-                for key, item in self.long_term_memory.items()
-            }
-            with open('data/memory.json', 'w') as f:
-                json.dump(memory_data, f, indent=2)
+            payload = b"".join(orjson.dumps(entry) + b"\n" for entry in entries)
+            # Reopened per write so appends never land in a log another process just compacted away
+            with _memory_files_lock():
+                with open('data/memory.log', 'ab') as f:
+                    f.write(payload)
+            self._log_entries += len(entries)
         except Exception as e:
             self.logger.error(f"Error saving memory: {str(e)}")
+            return
+        
+        if self._log_entries >= self.compact_after:
+            self.flush_memory()
     
-    def create_context(self, session_id: str, user_id: str) -> ConversationContext:
+    def create_context(
+        self,
+        session_id: str,
+        user_id: str,
+        context_window: int = DEFAULT_CONTEXT_WINDOW
+    ) -> ConversationContext:
         """Create a new conversation context"""
         context = ConversationContext(
             session_id=session_id,
@@ -87,7 +199,9 @@ class ContextManager:
             entities={},
             preferences={},
             last_interaction=datetime.now(),
-            conversation_history=[]
+            # Bounded by this context's own window, not the default
+            conversation_history=deque(maxlen=context_window),
+            context_window=context_window
         )
         self.contexts[session_id] = context
         return context
@@ -103,14 +217,19 @@ class ContextManager:
         response: str,
         intent: str,
         entities: Dict[str, List[str]],
-        sentiment: str
+        sentiment: str,
+        now: Optional[datetime] = None
     ):
         """Update conversation context with new interaction"""
-        if session_id not in self.contexts:
+        context = self.contexts.get(session_id)
+        if context is None:
             return
         
-        context = self.contexts[session_id]
-        context.last_interaction = datetime.now()
+        # One timestamp for the whole turn
+        if now is None:
+            now = datetime.now()
+        
+        context.last_interaction = now
         
         # Update current topic based on intent
         if intent != 'unknown':
@@ -120,24 +239,20 @@ class ContextManager:
         
         # Update entities
         for entity_type, entity_values in entities.items():
-            if entity_type not in context.entities:
-                context.entities[entity_type] = []
-            context.entities[entity_type].extend(
-                [ev for ev in entity_values if ev not in context.entities[entity_type]]
-            )
+            known_values = context.entities.setdefault(entity_type, [])
+            # Set lookup instead of scanning the list for every incoming value
+            seen = set(known_values)
+            known_values.extend([ev for ev in entity_values if ev not in seen])
         
-        # Update conversation history
+        # Update conversation history; the deque drops the oldest message
+        # once context_window is reached
         context.conversation_history.append({
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'user_message': message,
             'bot_response': response,
             'intent': intent,
             'sentiment': sentiment
         })
-        
-        # Keep only the most recent messages
-        if len(context.conversation_history) > context.context_window:
-            context.conversation_history = context.conversation_history[-context.context_window:]
     
     def store_memory(
         self,
@@ -148,10 +263,11 @@ class ContextManager:
         metadata: Optional[Dict] = None
     ):
         """Store information in long-term memory"""
+        now = datetime.now()
         memory_item = MemoryItem(
             key=key,
             value=value,
-            timestamp=datetime.now(),
+            timestamp=now,
             importance=importance,
             category=category,
             metadata=metadata or {}
@@ -159,28 +275,46 @@ class ContextManager:
         self.long_term_memory[key] = memory_item
         
         # Clean up old or low-importance memories if needed
-        self._cleanup_memory()
+        removed_keys = self._cleanup_memory(now)
         
-        # Save memory to file
-        self._save_memory()
+        # Record the change (and any evictions) in the memory log
+        entries = [{'key': removed, 'deleted': True} for removed in removed_keys]
+        if key in self.long_term_memory:
+            entries.append({'key': key, **self._memory_to_record(memory_item)})
+        self._append_to_log(entries)
     
-    def _cleanup_memory(self):
-        """Clean up old or low-importance memories"""
-        current_time = datetime.now()
+    def flush_memory(self):
+        """Fold any logged memory changes into memory.json"""
+        if self._log_entries:
+            _compact_memory_log()
+            self._log_entries = 0
+    
+    def _cleanup_memory(self, now: Optional[datetime] = None) -> List[str]:
+        """Clean up old or low-importance memories and return the removed keys"""
+        previous = self.long_term_memory
+        
+        # A memory is kept while fewer than memory_retention_days + 1 whole days
+        # old, i.e. while its timestamp is after this cutoff
+        cutoff = (now or datetime.now()) - timedelta(days=self.memory_retention_days + 1)
         
         # Remove memories older than retention period
         self.long_term_memory = {
             k: v for k, v in self.long_term_memory.items()
-            if (current_time - v.timestamp).days <= self.memory_retention_days
+            if v.timestamp > cutoff
         }
         
-        # If still too many items, remove lowest importance ones
+        # If still too many items, keep the most important ones (the newest
+        # among equal importance) without sorting every memory
         if len(self.long_term_memory) > self.max_memory_items:
-            sorted_memories = sorted(
-                self.long_term_memory.items(),
+            self.long_term_memory = dict(heapq.nlargest(
+                self.max_memory_items,
+                reversed(self.long_term_memory.items()),
                 key=lambda x: x[1].importance
-            )
-            self.long_term_memory = dict(sorted_memories[-self.max_memory_items:])
+            ))
+        
+        if len(self.long_term_memory) == len(previous):
+            return []
+        return [k for k in previous if k not in self.long_term_memory]
     
     def retrieve_memory(
         self,
@@ -190,6 +324,7 @@ class ContextManager:
     ) -> List[MemoryItem]:
         """Retrieve relevant memories based on query"""
         relevant_memories = []
+        query_lower = query.lower()
         
         for memory in self.long_term_memory.values():
             if memory.importance < min_importance:
@@ -199,17 +334,17 @@ class ContextManager:
                 continue
             
             # Simple text matching for now - could be enhanced with semantic search
-            if query.lower() in str(memory.value).lower():
+            if query_lower in memory.search_text:
                 relevant_memories.append(memory)
         
         return sorted(relevant_memories, key=lambda x: x.importance, reverse=True)
     
     def get_conversation_summary(self, session_id: str) -> Dict:
         """Get a summary of the conversation"""
-        if session_id not in self.contexts:
+        context = self.contexts.get(session_id)
+        if context is None:
             return {}
         
-        context = self.contexts[session_id]
         return {
             'current_topic': context.current_topic,
             'previous_topics': context.previous_topics,
@@ -221,8 +356,7 @@ class ContextManager:
     
     def clear_context(self, session_id: str):
         """Clear conversation context"""
-        if session_id in self.contexts:
-            del self.contexts[session_id]
+        self.contexts.pop(session_id, None)
     
     def clear_all_contexts(self):
         """Clear all conversation contexts"""
@@ -1,8 +1,11 @@
-import json
 import logging
-from typing import Dict, List, Optional, Any
+import mmap
+import orjson
+import re
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from dataclasses import dataclass, field
 import requests
 from requests.exceptions import RequestException
 import aiohttp
@@ -11,29 +14,44 @@ from bs4 import BeautifulSoup
 import feedparser
 import xml.etree.ElementTree as ET
 from security import SecurityManager
+from error_handler import backoff_delay
 
-class DataSourceConfig(BaseModel):
+# Longest wait between API fetch retries, in seconds
+MAX_RETRY_DELAY = 60.0
+
+# Type names accepted by 'type' validation rules
+VALIDATION_TYPES = {
+    'int': int,
+    'float': float,
+    'str': str,
+    'bool': bool,
+    'list': list,
+    'dict': dict,
+    'tuple': tuple
+}
+
+@dataclass
+class DataSourceConfig:
     """Configuration for a data source"""
     name: str
     type: str
     url: str
     api_key: Optional[str] = None
     refresh_interval: int = 300  # seconds
-    validation_rules: Dict[str, Any] = {}
-    headers: Dict[str, str] = {}
-    params: Dict[str, str] = {}
+    validation_rules: Dict[str, Any] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)
+    params: Dict[str, str] = field(default_factory=dict)
     timeout: int = 30
     retry_attempts: int = 3
     retry_delay: int = 5
 
-    @validator('type')
-    def validate_type(cls, v):
+    def __post_init__(self):
         valid_types = ['api', 'rss', 'web_scrape', 'database', 'file']
-        if v not in valid_types:
+        if self.type not in valid_types:
             raise ValueError(f'Invalid data source type. Must be one of {valid_types}')
-        return v
 
-class DataValidationRule(BaseModel):
+@dataclass
+class DataValidationRule:
     """Validation rule for data"""
     field: str
     rule_type: str
@@ -41,11 +59,21 @@ class DataValidationRule(BaseModel):
     error_message: str
 
 class DataSourceManager:
-    def __init__(self, security_manager: SecurityManager):
+    def __init__(self, security_manager: SecurityManager, max_concurrency: int = 16):
         self.security_manager = security_manager
+        self.max_concurrency = max_concurrency
         self.data_sources: Dict[str, DataSourceConfig] = {}
         self.validation_rules: Dict[str, List[DataValidationRule]] = {}
+        # Compiled 'regex' rule patterns, keyed by pattern string
+        self._compiled_patterns: Dict[str, re.Pattern] = {}
         self.logger = logging.getLogger(__name__)
+        # One HTTP session shared by every fetch so connections are kept alive and reused;
+        # opened and closed by `async with DataSourceManager(...)`
+        self._session: Optional[aiohttp.ClientSession] = None
+        # API responses per source: (expires_at, data, etag, last_modified)
+        self._response_cache: Dict[str, Tuple[float, Any, Optional[str], Optional[str]]] = {}
+        # One lock per source so concurrent cache misses make a single upstream call
+        self._fetch_locks: Dict[str, asyncio.Lock] = {}
         
         # Initialize data source configurations
         self._load_data_sources()
@@ -56,8 +84,8 @@ class DataSourceManager:
     def _load_data_sources(self):
         """Load data source configurations"""
         try:
-            with open('config/data_sources.json', 'r') as f:
-                sources = json.load(f)
+            with open('config/data_sources.json', 'rb') as f:
+                sources = orjson.loads(f.read())
                 for source in sources:
                     config = DataSourceConfig(**source)
                     self.data_sources[config.name] = config
@@ -69,17 +97,62 @@ class DataSourceManager:
     def _load_validation_rules(self):
         """Load validation rules"""
         try:
-            with open('config/validation_rules.json', 'r') as f:
-                rules = json.load(f)
+            with open('config/validation_rules.json', 'rb') as f:
+                rules = orjson.loads(f.read())
                 for source_name, source_rules in rules.items():
-                    self.validation_rules[source_name] = [
-                        DataValidationRule(**rule) for rule in source_rules
-                    ]
+                    self.validation_rules[source_name] = []
+                    for rule in source_rules:
+                        rule = DataValidationRule(**rule)
+                        if rule.rule_type == 'regex':
+                            # Compile regex rules up front rather than on first validation;
+                            # a bad pattern only drops its own rule
+                            try:
+                                self._compile_pattern(rule.parameters['pattern'])
+                            except re.error as e:
+                                self.logger.error(
+                                    f"Skipping invalid regex rule for {source_name}.{rule.field}: {str(e)}"
+                                )
+                                continue
+                        self.validation_rules[source_name].append(rule)
         except FileNotFoundError:
             self.logger.warning("Validation rules configuration file not found")
         except Exception as e:
             self.logger.error(f"Error loading validation rules: {str(e)}")
 
+    async def __aenter__(self) -> "DataSourceManager":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Open the shared HTTP session"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+
+    async def close(self):
+        """Close the shared HTTP session and its pooled connections"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        # The session and the locks belong to the loop that used them
+        self._fetch_locks.clear()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session opened by start()"""
+        if self._session is None or self._session.closed:
+            raise RuntimeError(
+                "DataSourceManager session is not open; use 'async with DataSourceManager(...)'"
+            )
+        return self._session
+
     async def fetch_data(self, source_name: str) -> Dict:
         """Fetch data from a source asynchronously"""
         if source_name not in self.data_sources:
@@ -104,35 +177,108 @@ class DataSourceManager:
             self.logger.error(f"Error fetching data from {source_name}: {str(e)}")
             raise
 
+    async def fetch_many(self, source_names: List[str]) -> Dict[str, Any]:
+        """
+        Fetch several sources concurrently, at most max_concurrency at a time.
+        Each name maps to its data, or to the exception raised while fetching it.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch_one(source_name: str) -> Any:
+            async with semaphore:
+                return await self.fetch_data(source_name)
+
+        results = await asyncio.gather(
+            *(fetch_one(name) for name in source_names),
+            return_exceptions=True
+        )
+        return dict(zip(source_names, results))
+
     async def _fetch_api_data(self, config: DataSourceConfig) -> Dict:
-        """Fetch data from an API"""
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(config.retry_attempts):
-                try:
-                    async with session.get(
-                        config.url,
-                        headers=config.headers,
-                        params=config.params,
-                        timeout=config.timeout
-                    ) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            return self._validate_data(config.name, data)
-                        else:
-                            self.logger.warning(
-                                f"API request failed with status {response.status}"
-                            )
-                except Exception as e:
-                    if attempt < config.retry_attempts - 1:
-                        await asyncio.sleep(config.retry_delay)
+        """Fetch data from an API, reusing the last response for refresh_interval seconds"""
+        cached = self._response_cache.get(config.name)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
+        lock = self._fetch_locks.setdefault(config.name, asyncio.Lock())
+        async with lock:
+            # Another caller may have refreshed the entry while this one waited
+            cached = self._response_cache.get(config.name)
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+            return await self._request_api_data(config, cached)
+
+    async def _request_api_data(
+        self,
+        config: DataSourceConfig,
+        cached: Optional[Tuple[float, Any, Optional[str], Optional[str]]]
+    ) -> Dict:
+        """Request API data, revalidating a stale cache entry with its validators"""
+        headers = config.headers
+        if cached:
+            headers = dict(headers)
+            if cached[2]:
+                headers['If-None-Match'] = cached[2]
+            if cached[3]:
+                headers['If-Modified-Since'] = cached[3]
+
+        session = await self._get_session()
+        for attempt in range(config.retry_attempts):
+            retry_after = None
+            try:
+                async with session.get(
+                    config.url,
+                    headers=headers,
+                    params=config.params,
+                    timeout=config.timeout
+                ) as response:
+                    if response.status == 304 and cached:
+                        # Unchanged upstream; keep serving the cached data
+                        self._response_cache[config.name] = (
+                            time.monotonic() + config.refresh_interval, *cached[1:]
+                        )
+                        return cached[1]
+                    elif response.status == 200:
+                        data = self._validate_data(config.name, orjson.loads(await response.read()))
+                        self._response_cache[config.name] = (
+                            time.monotonic() + config.refresh_interval,
+                            data,
+                            response.headers.get('ETag'),
+                            response.headers.get('Last-Modified')
+                        )
+                        return data
                     else:
-                        raise
+                        self.logger.warning(
+                            f"API request failed with status {response.status}"
+                        )
+                        retry_after = response.headers.get('Retry-After')
+            except Exception as e:
+                if attempt == config.retry_attempts - 1:
+                    raise
+
+            if attempt < config.retry_attempts - 1:
+                delay = backoff_delay(config.retry_delay, attempt, MAX_RETRY_DELAY)
+                if retry_after:
+                    try:
+                        delay = max(delay, float(retry_after))
+                    except ValueError:
+                        pass
+                await asyncio.sleep(delay)
         return {}
 
     async def _fetch_rss_data(self, config: DataSourceConfig) -> Dict:
         """Fetch data from an RSS feed"""
+        session = await self._get_session()
         try:
-            feed = feedparser.parse(config.url)
+            # Download on the shared session, then parse in a worker thread so
+            # feedparser's synchronous parsing never blocks the event loop
+            async with session.get(
+                config.url,
+                headers=config.headers,
+                timeout=config.timeout
+            ) as response:
+                body = await response.read()
+            feed = await asyncio.get_running_loop().run_in_executor(None, feedparser.parse, body)
             return self._validate_data(config.name, feed.entries)
         except Exception as e:
             self.logger.error(f"Error fetching RSS data: {str(e)}")
@@ -140,21 +286,25 @@ class DataSourceManager:
 
     async def _fetch_web_data(self, config: DataSourceConfig) -> Dict:
         """Fetch data by web scraping"""
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(
-                    config.url,
-                    headers=config.headers,
-                    timeout=config.timeout
-                ) as response:
-                    if response.status == 200:
-                        html = await response.text()
-                        soup = BeautifulSoup(html, 'html.parser')
-                        # Implement specific scraping logic based on config
-                        return self._validate_data(config.name, {})
-            except Exception as e:
-                self.logger.error(f"Error scraping web data: {str(e)}")
-                raise
+        session = await self._get_session()
+        try:
+            async with session.get(
+                config.url,
+                headers=config.headers,
+                timeout=config.timeout
+            ) as response:
+                if response.status == 200:
+                    html = await response.text()
+                    # Parse in a worker thread; html.parser is pure Python and
+                    # would otherwise block the event loop on large pages
+                    soup = await asyncio.get_running_loop().run_in_executor(
+                        None, BeautifulSoup, html, 'html.parser'
+                    )
+                    # Implement specific scraping logic based on config
+                    return self._validate_data(config.name, {})
+        except Exception as e:
+            self.logger.error(f"Error scraping web data: {str(e)}")
+            raise
 
     async def _fetch_database_data(self, config: DataSourceConfig) -> Dict:
         """Fetch data from a database"""
@@ -164,13 +314,22 @@ class DataSourceManager:
     async def _fetch_file_data(self, config: DataSourceConfig) -> Dict:
         """Fetch data from a file"""
         try:
-            with open(config.url, 'r') as f:
-                data = json.load(f)
-                return self._validate_data(config.name, data)
+            data = await asyncio.get_running_loop().run_in_executor(
+                None, self._read_json_file, config.url
+            )
+            return self._validate_data(config.name, data)
         except Exception as e:
             self.logger.error(f"Error reading file data: {str(e)}")
             raise
 
+    @staticmethod
+    def _read_json_file(path: str) -> Any:
+        """Parse a JSON file straight from a read-only memory map"""
+        with open(path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+
     def _validate_data(self, source_name: str, data: Any) -> Dict:
         """Validate data against configured rules"""
         if source_name not in self.validation_rules:
@@ -185,14 +344,17 @@ class DataSourceManager:
                     if rule.field not in data:
                         raise ValueError(rule.error_message)
                 elif rule.rule_type == 'type':
-                    if not isinstance(data.get(rule.field), eval(rule.parameters['type'])):
+                    expected_type = VALIDATION_TYPES.get(rule.parameters['type'])
+                    if expected_type is None:
+                        raise ValueError(f"Unknown type in validation rule: {rule.parameters['type']}")
+                    if not isinstance(data.get(rule.field), expected_type):
                         raise ValueError(rule.error_message)
                 elif rule.rule_type == 'range':
                     value = data.get(rule.field)
                     if not (rule.parameters['min'] <= value <= rule.parameters['max']):
                         raise ValueError(rule.error_message)
                 elif rule.rule_type == 'regex':
-                    if not re.match(rule.parameters['pattern'], str(data.get(rule.field))):
+                    if not self._compile_pattern(rule.parameters['pattern']).match(str(data.get(rule.field))):
                         raise ValueError(rule.error_message)
                 elif rule.rule_type == 'custom':
                     if not rule.parameters['function'](data.get(rule.field)):
@@ -203,6 +365,13 @@ class DataSourceManager:
 
         return data
 
+    def _compile_pattern(self, pattern: str) -> re.Pattern:
+        """Return the compiled form of a validation pattern, compiling it once"""
+        compiled = self._compiled_patterns.get(pattern)
+        if compiled is None:
+            compiled = self._compiled_patterns[pattern] = re.compile(pattern)
+        return compiled
+
     def add_data_source(self, config: DataSourceConfig):
         """Add a new data source"""
         self.data_sources[config.name] = config
@@ -224,27 +393,26 @@ class DataSourceManager:
     def _save_data_sources(self):
         """Save data source configurations"""
         try:
-            with open('config/data_sources.json', 'w') as f:
-                json.dump(
-                    [source.dict() for source in self.data_sources.values()],
-                    f,
-                    indent=2
-                )
+            # Serialize before opening so a failure cannot truncate the file
+            # orjson serializes the config dataclasses directly
+            payload = orjson.dumps(
+                list(self.data_sources.values()),
+                option=orjson.OPT_INDENT_2
+            )
+            with open('config/data_sources.json', 'wb') as f:
+                f.write(payload)
         except Exception as e:
             self.logger.error(f"Error saving data sources: {str(e)}")
 
     def _save_validation_rules(self):
         """Save validation rules"""
         try:
-            with open('config/validation_rules.json', 'w') as f:
-                json.dump(
-                    {
-                        source: [rule.dict() for rule in rules]
-                        for source, rules in self.validation_rules.items()
-                    },
-                    f,
-                    indent=2
-                )
+            payload = orjson.dumps(
+                self.validation_rules,
+                option=orjson.OPT_INDENT_2
+            )
+            with open('config/validation_rules.json', 'wb') as f:
+                f.write(payload)
         except Exception as e:
             self.logger.error(f"Error saving validation rules: {str(e)}")
 
@@ -1,15 +1,22 @@
 import logging
-from typing import Dict, List, Optional, Any, Callable
+from typing import Deque, Dict, List, Optional, Any, Callable
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import deque
 from enum import Enum
 import json
 import asyncio
-from pydantic import BaseModel
 import traceback
+import time
+import random
 import sys
 from functools import wraps
 
+def backoff_delay(base: float, attempt: int, cap: Optional[float] = None) -> float:
+    """Exponential backoff for a retry attempt, jittered so clients don't retry in lockstep"""
+    delay = base * (2 ** attempt) + random.uniform(0, base)
+    return delay if cap is None else min(delay, cap)
+
 class ErrorSeverity(Enum):
     """Severity levels for errors"""
     LOW = "low"
@@ -33,26 +40,54 @@ class ErrorType(Enum):
 @dataclass
 class ErrorContext:
     """Context information for an error"""
+    # Hand-written for Python 3.8 support; traceback_exception has no default
+    # because a slot can't share its name with a class attribute
+    __slots__ = ('error_type', 'severity', 'message', 'timestamp', 'metadata', 'traceback_exception')
     error_type: ErrorType
     severity: ErrorSeverity
     message: str
     timestamp: datetime
-    stack_trace: str
     metadata: Dict[str, Any]
+    # Frame-free snapshot of the traceback; only formatted if stack_trace is read
+    traceback_exception: Optional[traceback.TracebackException]
+
+    @property
+    def stack_trace(self) -> str:
+        """Formatted traceback of the exception, built on access"""
+        if self.traceback_exception is None:
+            return ""
+        return "".join(self.traceback_exception.format())
 
-class RecoveryStrategy(BaseModel):
+@dataclass
+class RecoveryStrategy:
     """Strategy for recovering from errors"""
     name: str
     description: str
     retry_count: int = 3
     retry_delay: int = 5
     fallback_action: Optional[str] = None
-    conditions: Dict[str, Any] = {}
+    conditions: Dict[str, Any] = field(default_factory=dict)
 
 class ErrorHandler:
-    def __init__(self, recovery_strategies: Optional[Dict[ErrorType, RecoveryStrategy]] = None):
+    # Recovery handlers by error type and fallback handlers by strategy action,
+    # named here and looked up on the instance when dispatched
+    RECOVERY_HANDLERS = {
+        ErrorType.NETWORK: "_retry_network_operation",
+        ErrorType.DATABASE: "_switch_database",
+        ErrorType.API: "_retry_api_call",
+        ErrorType.RATE_LIMIT: "_handle_rate_limit"
+    }
+    FALLBACK_HANDLERS = {
+        "use_cached_data": "_use_cached_data",
+        "use_read_replica": "_use_read_replica",
+        "use_cached_response": "_use_cached_response",
+        "queue_request": "_queue_request"
+    }
+
+    def __init__(self, recovery_strategies: Optional[Dict[ErrorType, RecoveryStrategy]] = None, max_history: int = 10000):
         self.logger = logging.getLogger(__name__)
-        self.error_history: List[ErrorContext] = []
+        # Oldest errors are dropped automatically once max_history is reached
+        self.error_history: Deque[ErrorContext] = deque(maxlen=max_history)
         self.recovery_strategies = recovery_strategies or self._get_default_strategies()
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
 
@@ -98,8 +133,10 @@ class ErrorHandler:
                 severity=self._determine_severity(error, error_type),
                 message=str(error),
                 timestamp=datetime.now(),
-                stack_trace=traceback.format_exc(),
-                metadata=metadata or {}
+                metadata=metadata or {},
+                traceback_exception=traceback.TracebackException.from_exception(
+                    error, lookup_lines=False
+                )
             )
             
             # Log error
@@ -156,7 +193,7 @@ class ErrorHandler:
                 try:
                     # Wait before retry if not first attempt
                     if attempt > 0:
-                        await asyncio.sleep(strategy.retry_delay * (2 ** attempt))
+                        await asyncio.sleep(backoff_delay(strategy.retry_delay, attempt))
                     
                     # Execute recovery action
                     return await self._execute_recovery(context, strategy)
@@ -182,29 +219,15 @@ class ErrorHandler:
     async def _execute_recovery(self, context: ErrorContext, strategy: RecoveryStrategy) -> Any:
         """Execute the recovery action"""
         # Implement recovery logic based on error type and strategy
-        if context.error_type == ErrorType.NETWORK:
-            return await self._retry_network_operation(context)
-        elif context.error_type == ErrorType.DATABASE:
-            return await self._switch_database(context)
-        elif context.error_type == ErrorType.API:
-            return await self._retry_api_call(context)
-        elif context.error_type == ErrorType.RATE_LIMIT:
-            return await self._handle_rate_limit(context)
-        else:
-            return await self._generic_recovery(context)
+        handler_name = self.RECOVERY_HANDLERS.get(context.error_type, "_generic_recovery")
+        return await getattr(self, handler_name)(context)
 
     async def _execute_fallback(self, context: ErrorContext, strategy: RecoveryStrategy) -> Any:
         """Execute the fallback action"""
-        if strategy.fallback_action == "use_cached_data":
-            return await self._use_cached_data(context)
-        elif strategy.fallback_action == "use_read_replica":
-            return await self._use_read_replica(context)
-        elif strategy.fallback_action == "use_cached_response":
-            return await self._use_cached_response(context)
-        elif strategy.fallback_action == "queue_request":
-            return await self._queue_request(context)
-        else:
+        handler_name = self.FALLBACK_HANDLERS.get(strategy.fallback_action)
+        if handler_name is None:
             return None
+        return await getattr(self, handler_name)(context)
 
     def get_error_history(self, time_window: Optional[timedelta] = None) -> List[Dict]:
         """Get error history with optional time window"""
@@ -231,14 +254,13 @@ class ErrorHandler:
     def clear_error_history(self, time_window: Optional[timedelta] = None):
         """Clear error history older than the specified time window"""
         if not time_window:
-            self.error_history = []
+            self.error_history.clear()
             return
             
+        # History is in arrival order, so expired errors are all at the left
         cutoff = datetime.now() - time_window
-        self.error_history = [
-            context for context in self.error_history
-            if context.timestamp >= cutoff
-        ]
+        while self.error_history and self.error_history[0].timestamp < cutoff:
+            self.error_history.popleft()
 
 class CircuitBreaker:
     """Circuit breaker pattern implementation"""
@@ -246,14 +268,15 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.reset_timeout = reset_timeout
         self.failures = 0
-        self.last_failure_time = None
+        # time.monotonic() of the last failure; immune to wall-clock changes
+        self.last_failure_time: Optional[float] = None
         self.state = "closed"
 
     def is_open(self) -> bool:
         """Check if circuit breaker is open"""
         if self.state == "open":
-            if self.last_failure_time and \
-               (datetime.now() - self.last_failure_time).total_seconds() > self.reset_timeout:
+            if self.last_failure_time is not None and \
+               time.monotonic() - self.last_failure_time > self.reset_timeout:
                 self.state = "half-open"
                 return False
             return True
@@ -262,7 +285,7 @@ class CircuitBreaker:
     def record_failure(self):
         """Record a failure"""
         self.failures += 1
-        self.last_failure_time = datetime.now()
+        self.last_failure_time = time.monotonic()
         
         if self.failures >= self.failure_threshold:
             self.state = "open"
@@ -272,16 +295,26 @@ class CircuitBreaker:
         self.failures = 0
         self.state = "closed"
 
+# Process-wide handler used by the error_handler decorator, created on first error
+_default_handler: Optional[ErrorHandler] = None
+
+def get_default_handler() -> ErrorHandler:
+    """Return the shared ErrorHandler, creating it on first use"""
+    global _default_handler
+    if _default_handler is None:
+        _default_handler = ErrorHandler()
+    return _default_handler
+
 def error_handler(error_type: ErrorType):
     """Decorator for error handling"""
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            handler = ErrorHandler()
             try:
                 return await func(*args, **kwargs)
             except Exception as e:
-                return await handler.handle_error(e, error_type, {
+                # Shared so history and circuit-breaker state persist across calls
+                return await get_default_handler().handle_error(e, error_type, {
                     'function': func.__name__,
                     'args': str(args),
                     'kwargs': str(kwargs)
@@ -14,6 +14,15 @@ def init_database():
     conn = sqlite3.connect(os.getenv('DATABASE_URL').replace('sqlite:///', ''))
     cursor = conn.cursor()
 
+    # WAL lets the chatbot's readers and writers work concurrently; the mode is
+    # stored in the database file, so it also applies to runtime connections
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+
+    # Run the whole schema setup as one transaction so it is synced to disk once
+    cursor.execute('BEGIN')
+
     # Create users table
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS users (
@@ -52,6 +61,10 @@ def init_database():
     )
     ''')
 
+    # Index the foreign keys used to look up a user's conversations and their messages
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_conversations_user ON conversations (user_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_messages_conversation ON messages (conversation_id)')
+
     # Create knowledge_base table
     cursor.execute('''
     CREATE TABLE IF NOT EXISTS knowledge_base (
@@ -4,8 +4,9 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import List, Optional
 import jwt
+import asyncio
 from dotenv import load_dotenv
 import os
 from pydantic import BaseModel
@@ -31,6 +32,12 @@ app.add_middleware(
 
 # Security
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+# Token signing settings, read once after .env has been loaded
+JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM")
+DEFAULT_TOKEN_EXPIRY = timedelta(minutes=15)
+# Most messages one /chat/batch request may carry
+MAX_BATCH_MESSAGES = 20
 
 # Models
 class Message(BaseModel):
@@ -47,6 +54,9 @@ class TokenData(BaseModel):
 class ChatMessage(BaseModel):
     message: str
 
+class BatchChatMessage(BaseModel):
+    messages: List[str]
+
 # Initialize chatbot
 chatbot = SimpleAsha(data_dir="data")
 
@@ -66,7 +76,10 @@ async def read_root(request: Request):
 @app.post("/chat")
 async def chat(message: ChatMessage, token: str = Depends(oauth2_scheme)):
     try:
-        response = chatbot.get_response(message.message)
+        # Run the synchronous chatbot in a worker thread so other requests keep being served
+        response = await asyncio.get_running_loop().run_in_executor(
+            None, chatbot.get_response, message.message
+        )
         return JSONResponse(content={"response": response["text"]})
     except Exception as e:
         print(f"Error: {str(e)}")
@@ -75,6 +88,27 @@ async def chat(message: ChatMessage, token: str = Depends(oauth2_scheme)):
             status_code=500
         )
 
+@app.post("/chat/batch")
+async def chat_batch(batch: BatchChatMessage, token: str = Depends(oauth2_scheme)):
+    # Convenience wrapper: saves round trips, but each message is still answered
+    # on its own, so batches are capped to keep one request from holding a worker
+    if len(batch.messages) > MAX_BATCH_MESSAGES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"A batch may contain at most {MAX_BATCH_MESSAGES} messages"
+        )
+    try:
+        responses = await asyncio.get_running_loop().run_in_executor(
+            None, chatbot.get_batch_responses, [(None, message) for message in batch.messages]
+        )
+        return JSONResponse(content={"responses": [response["text"] for response in responses]})
+    except Exception as e:
+        print(f"Error: {str(e)}")
+        return JSONResponse(
+            content={"responses": [], "error": "I apologize, but I encountered an error. Please try again."},
+            status_code=500
+        )
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy", "timestamp": datetime.now().isoformat()}
@@ -84,15 +118,23 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
+        expire = datetime.utcnow() + DEFAULT_TOKEN_EXPIRY
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(
         to_encode,
-        os.getenv("JWT_SECRET_KEY"),
-        algorithm=os.getenv("JWT_ALGORITHM")
+        JWT_SECRET_KEY,
+        algorithm=JWT_ALGORITHM
     )
     return encoded_jwt
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
\ No newline at end of file
+    # Chatbot analytics, history and caches live in each worker process, so
+    # WEB_CONCURRENCY > 1 splits them; use `uvicorn main:app --reload` for development
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", 1)),
+        log_level="warning"
+    )
\ No newline at end of file
@@ -4,6 +4,7 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import statistics
 import json
+from itertools import chain
 import os
 from dataclasses import dataclass
 from enum import Enum
@@ -20,6 +21,8 @@ class MetricType(Enum):
 
 @dataclass
 class PerformanceMetric:
+    # Explicit __slots__ as dataclass(slots=True) needs Python 3.10
+    __slots__ = ('metric_type', 'value', 'timestamp', 'context')
     metric_type: MetricType
     value: float
     timestamp: datetime
@@ -127,12 +130,13 @@ class PerformanceMonitor:
         if metric_type:
             metrics = self.metrics[metric_type.value]
         else:
-            metrics = [m for metrics_list in self.metrics.values() for m in metrics_list]
+            # Stream across all metric lists without building a flattened copy first
+            metrics = chain.from_iterable(self.metrics.values())
         
-        if not metrics:
+        values = [m.value for m in metrics]
+        if not values:
             return {}
         
-        values = [m.value for m in metrics]
         return {
             'mean': statistics.mean(values),
             'median': statistics.median(values),
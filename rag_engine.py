@@ -3,9 +3,8 @@ RAG (Retrieval Augmented Generation) Engine for Asha AI Chatbot
 """
 
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Optional
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 import json
 import os
 
@@ -19,6 +18,9 @@ class RAGEngine:
             'careers', 'jobs', 'events', 'mentorship',
             'skills', 'success_stories', 'resources'
         ]
+        # Search results keyed by (query, category, top_k); cleared whenever embeddings change
+        self.search_cache: Dict[Tuple[str, Optional[str], int], List[Dict[str, Any]]] = {}
+        self.search_cache_size = 512
         
     def initialize_knowledge_base(self, data_path: str = 'data/'):
         """Initialize knowledge base from data files"""
@@ -65,7 +67,9 @@ class RAGEngine:
         
         # Generate embeddings for all texts in the category
         if texts:
-            embeddings = self.model.encode(texts, convert_to_tensor=True)
+            self.search_cache.clear()
+            # Unit-length vectors, so cosine similarity is a plain dot product at query time
+            embeddings = self.model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
             self.embeddings[category] = {
                 'vectors': embeddings,
                 'texts': texts,
@@ -84,22 +88,27 @@ class RAGEngine:
         Returns:
             List of relevant documents with their metadata
         """
+        cache_key = (query, category, top_k)
+        if cache_key in self.search_cache:
+            return [dict(result) for result in self.search_cache[cache_key]]
+        
         # Encode the query
-        query_embedding = self.model.encode(query, convert_to_tensor=True)
+        query_embedding = self.model.encode(query, convert_to_numpy=True, normalize_embeddings=True)
         
         results = []
         categories_to_search = [category] if category else self.categories
         
         for cat in categories_to_search:
             if cat in self.embeddings:
-                # Calculate similarity scores
-                similarities = cosine_similarity(
-                    query_embedding.reshape(1, -1),
-                    self.embeddings[cat]['vectors']
-                )[0]
+                # Calculate similarity scores; both sides are pre-normalized
+                similarities = self.embeddings[cat]['vectors'] @ query_embedding
                 
-                # Get top matches
-                top_indices = np.argsort(similarities)[-top_k:][::-1]
+                # Get top matches, partitioning before sorting only the top_k
+                if len(similarities) > top_k:
+                    top_indices = np.argpartition(similarities, -top_k)[-top_k:]
+                else:
+                    top_indices = np.arange(len(similarities))
+                top_indices = top_indices[np.argsort(similarities[top_indices])[::-1]]
                 
                 # Add results with their metadata and scores
                 for idx in top_indices:
@@ -112,7 +121,12 @@ class RAGEngine:
         
         # Sort all results by similarity score
         results.sort(key=lambda x: x['similarity'], reverse=True)
-        return results[:top_k]
+        results = results[:top_k]
+        
+        if len(self.search_cache) >= self.search_cache_size:
+            self.search_cache.pop(next(iter(self.search_cache)))
+        self.search_cache[cache_key] = results
+        return [dict(result) for result in results]
     
     def generate_response(self, query: str, context: List[Dict[str, Any]]) -> str:
         """
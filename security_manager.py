@@ -10,7 +10,6 @@ import logging
 from datetime import datetime, timedelta
 import jwt
 from functools import wraps
-import re
 from enum import Enum
 import uuid
 from fastapi import HTTPException, status
@@ -57,15 +56,6 @@ class SecurityManager:
             'guest': ['read']
         }
         
-        # Data anonymization rules
-        self.anonymization_rules = {
-            'email': r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-            'phone': r'\b\d{10}\b',
-            'ssn': r'\b\d{3}-\d{2}-\d{4}\b',
-            'credit_card': r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b',
-            'bank_account': r'\b\d{8,17}\b'
-        }
-        
         # Security policies
         self.security_policies = {
             'password_policy': {
@@ -171,28 +161,6 @@ class SecurityManager:
             logger.error(f"Error decrypting data: {e}")
             raise
 
-    def anonymize_data(self, data: Dict[str, Any], level: str = 'high') -> Dict[str, Any]:
-        """Enhanced data anonymization with multiple levels."""
-        try:
-            anonymized_data = data.copy()
-            
-            for field, pattern in self.anonymization_rules.items():
-                if field in anonymized_data:
-                    value = str(anonymized_data[field])
-                    if level == 'high':
-                        anonymized_data[field] = '*' * len(value)
-                    elif level == 'medium':
-                        anonymized_data[field] = re.sub(
-                            pattern,
-                            lambda m: m.group()[:2] + '*' * (len(m.group()) - 2),
-                            value
-                        )
-            
-            return anonymized_data
-        except Exception as e:
-            logger.error(f"Error anonymizing data: {e}")
-            return data
-
     def generate_token(self, user_id: str, role: str, expires_in: int = 3600) -> str:
         """Enhanced token generation with additional security claims."""
         try:
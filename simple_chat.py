@@ -1,17 +1,40 @@
 import json
 import random
+import re
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from utils.bias_detector import BiasDetector
 from utils.knowledge_base import KnowledgeBase
 
+# Whole-message replies, frozen for O(1) membership checks
+AFFIRMATIVE_REPLIES = frozenset(['yes', 'yeah', 'sure', 'okay', 'ok', 'yep', 'yup', 'ha', 'haan'])
+NEGATIVE_REPLIES = frozenset(['no', 'nah', 'nope', 'not', 'nahi'])
+EXIT_COMMANDS = frozenset(['exit', 'quit', 'bye', 'goodbye'])
+
 class SimpleAsha:
+    # Substring keywords for each routing check in get_response
+    INTENT_KEYWORDS = {
+        'greeting': ['hi', 'hello', 'hey', 'namaste'],
+        'help': ['help', 'what can you do'],
+        'professional_development': ['professional', 'development', 'course', 'training', 'learn', 'skill'],
+        'events': ['event', 'workshop', 'webinar', 'conference', 'meetup'],
+        'jobs': ['job', 'work', 'career', 'opportunity', 'position', 'opening', 'vacancy'],
+        'event_listing': ['event', 'workshop', 'webinar', 'conference'],
+        'mentorship': ['mentor', 'guide', 'advice', 'guidance'],
+        'education': ['course', 'training', 'learn', 'study', 'education']
+    }
+
     def __init__(self, data_dir: str = "data"):
         # Set data directory
         self.data_dir = Path(data_dir)
         # Initialize FAQ system
         self.faqs = self._load_faqs()
+        self.faq_index = self._build_faq_index()
+        # Single-pass keyword scanner for intent routing
+        self._build_keyword_scanner()
         # Initialize user profiles
         self.user_profiles = {}
         # Initialize program categories
@@ -81,6 +104,10 @@ class SimpleAsha:
             "company": "company",
             "platform": "platform"
         }
+        # Whole whitespace-delimited words only, so it maps exactly the tokens split() would
+        self.hinglish_pattern = re.compile(
+            r'(?<!\S)(?:' + '|'.join(sorted(map(re.escape, self.hinglish_map), key=len, reverse=True)) + r')(?!\S)'
+        )
         self.responses = {
             'greeting': [
                 "Hello! I'm Asha, your AI career companion. How can I help you today?",
@@ -109,20 +136,19 @@ class SimpleAsha:
         self.knowledge_base = KnowledgeBase()
         self.conversation_history = {}
         self.analytics = {}
+        # The API answers on worker threads; guards analytics and history updates
+        self._state_lock = threading.Lock()
 
     def translate_hinglish(self, text: str) -> str:
         """Convert Hinglish text to English"""
         words = text.split()
-        translated = []
-        
-        for word in words:
-            # Check if word exists in hinglish mapping
-            if word in self.hinglish_map:
-                translated.append(self.hinglish_map[word])
-            else:
-                translated.append(word)
-        
-        return " ".join(translated)
+        normalized = " ".join(words)
+        # Fast path: most messages are plain English with no mapped words
+        if self.hinglish_map.keys().isdisjoint(words):
+            return normalized
+        # Translate every mapped word in a single substitution pass
+        hinglish_map = self.hinglish_map
+        return self.hinglish_pattern.sub(lambda match: hinglish_map[match.group()], normalized)
 
     def get_response(self, user_input: str, session_id: Optional[str] = None) -> Dict:
         try:
@@ -130,25 +156,33 @@ class SimpleAsha:
             response = {"text": "", "type": "text"}
 
             # Track analytics
-            if session_id not in self.analytics:
-                self.analytics[session_id] = {
-                    "total_interactions": 0,
-                    "biased_queries": 0,
-                    "successful_responses": 0
-                }
-            self.analytics[session_id]["total_interactions"] += 1
+            with self._state_lock:
+                if session_id not in self.analytics:
+                    self.analytics[session_id] = {
+                        "total_interactions": 0,
+                        "biased_queries": 0,
+                        "successful_responses": 0
+                    }
+                self.analytics[session_id]["total_interactions"] += 1
+
+            # Normalize the raw input once; the checks below all work on lowercase text
+            input_lower = user_input.lower()
 
             # Translate Hinglish to English
-            processed_input = self.translate_hinglish(user_input.lower())
+            processed_input = self.translate_hinglish(input_lower)
 
             # Check for bias
             has_bias, biases, suggestions = self.bias_detector.detect_bias(processed_input)
             if has_bias:
-                self.analytics[session_id]["biased_queries"] += 1
+                with self._state_lock:
+                    self.analytics[session_id]["biased_queries"] += 1
                 return {"text": f"I noticed some potential bias in your query. Here's a more inclusive way to phrase it: {suggestions[0]}"}
 
+            # Find every keyword category in one scan of the input
+            hits = self._keyword_hits(processed_input)
+
             # Check for greetings
-            if any(word in processed_input for word in ['hi', 'hello', 'hey', 'namaste']):
+            if 'greeting' in hits:
                 return {"text": "👋 Hello! I'm Asha, your AI career companion. I can help you with:\n\n" + \
                         "1. Finding job opportunities\n" + \
                         "2. Career guidance and mentorship\n" + \
@@ -158,7 +192,7 @@ class SimpleAsha:
                         "What would you like to explore?"}
 
             # Check for yes/no responses
-            if processed_input in ['yes', 'yeah', 'sure', 'okay', 'ok', 'yep', 'yup', 'ha', 'haan']:
+            if processed_input in AFFIRMATIVE_REPLIES:
                 return {"text": "Great! Let me help you explore your career options. Are you interested in:\n\n" + \
                         "1. Job Search & Opportunities\n" + \
                         "2. Skill Development & Training\n" + \
@@ -166,7 +200,7 @@ class SimpleAsha:
                         "4. Events & Networking\n\n" + \
                         "Please choose a number or tell me what you're looking for! 🌟"}
 
-            if processed_input in ['no', 'nah', 'nope', 'not', 'nahi']:
+            if processed_input in NEGATIVE_REPLIES:
                 return {"text": "No problem! Feel free to ask me about:\n\n" + \
                         "• Job opportunities\n" + \
                         "• Career development\n" + \
@@ -176,7 +210,7 @@ class SimpleAsha:
                         "I'm here to help! 😊"}
 
             # Check for help queries
-            if 'help' in processed_input or 'what can you do' in processed_input:
+            if 'help' in hits:
                 return {"text": "I'm here to help with your career journey! You can ask me about:\n\n" + \
                         "• Job opportunities & openings\n" + \
                         "• Career guidance & planning\n" + \
@@ -186,7 +220,7 @@ class SimpleAsha:
                         "What would you like to explore?"}
 
             # Check for professional development queries
-            if any(word in processed_input for word in ['professional', 'development', 'course', 'training', 'learn', 'skill']):                
+            if 'professional_development' in hits:
                 return {
                     "text": "🌟 Here are some excellent professional development opportunities from JobsForHer Foundation:\n\n" + \
                             "1. herShakti Program:\n" + \
@@ -206,7 +240,7 @@ class SimpleAsha:
                 }
 
             # Check for events and workshops
-            if any(word in processed_input for word in ['event', 'workshop', 'webinar', 'conference', 'meetup']):
+            if 'events' in hits:
                 return {
                     "text": "📅 Exciting upcoming events from JobsForHer Foundation:\n\n" + \
                             "1. DivHERsity.club Sessions:\n" + \
@@ -225,82 +259,87 @@ class SimpleAsha:
                 }
 
             # Check for job-related queries
-            if any(word in processed_input for word in ['job', 'work', 'career', 'opportunity', 'position', 'opening', 'vacancy']):
+            if 'jobs' in hits:
                 job_listings = self.knowledge_base.get_job_listings()
                 if job_listings:
-                    response["text"] = "💼 Here are some exciting job opportunities:\n\n"
+                    lines = ["💼 Here are some exciting job opportunities:\n"]
                     for job in job_listings[:3]:
-                        response["text"] += f"• {job['title']} at {job['company']}\n"
-                        response["text"] += f"  📍 Location: {job['location']}\n"
-                        response["text"] += f"  💵 {job['salary']}\n\n"
-                    response["text"] += "Would you like to know more about any of these positions?"
+                        lines.append(f"• {job['title']} at {job['company']}\n"
+                                     f"  📍 Location: {job['location']}\n"
+                                     f"  💵 {job['salary']}\n")
+                    lines.append("Would you like to know more about any of these positions?")
+                    response["text"] = "\n".join(lines)
                 else:
                     response["text"] = "I'm currently updating our job listings. Please check back in a few minutes or tell me what kind of job you're looking for!"
 
             # Check for event-related queries
-            elif any(word in processed_input for word in ['event', 'workshop', 'webinar', 'conference']):
+            elif 'event_listing' in hits:
                 events = self.knowledge_base.get_events()
                 if events:
-                    response["text"] = "📅 Here are upcoming events you might be interested in:\n\n"
+                    lines = ["📅 Here are upcoming events you might be interested in:\n"]
                     for event in events[:3]:
-                        response["text"] += f"• {event['title']}\n"
-                        response["text"] += f"  📆 Date: {event['date']}\n"
-                        response["text"] += f"  📍 {event['location']}\n\n"
-                    response["text"] += "Would you like to register for any of these events?"
+                        lines.append(f"• {event['title']}\n"
+                                     f"  📆 Date: {event['date']}\n"
+                                     f"  📍 {event['location']}\n")
+                    lines.append("Would you like to register for any of these events?")
+                    response["text"] = "\n".join(lines)
                 else:
                     response["text"] = "I'm currently updating our event calendar. Please check back soon for exciting events and workshops!"
 
             # Check for mentorship-related queries
-            elif any(word in processed_input for word in ['mentor', 'guide', 'advice', 'guidance']):
+            elif 'mentorship' in hits:
                 mentors = self.knowledge_base.get_mentorship_programs()
                 if mentors:
-                    response["text"] = "👩‍💻 Here are some mentorship opportunities:\n\n"
+                    lines = ["👩‍💻 Here are some mentorship opportunities:\n"]
                     for mentor in mentors[:3]:
-                        response["text"] += f"• {mentor['name']} - {mentor['expertise']}\n"
-                        response["text"] += f"  💼 Experience: {mentor['experience']} years\n"
-                        response["text"] += f"  🎓 {mentor['background']}\n\n"
-                    response["text"] += "Would you like to connect with any of these mentors?"
+                        lines.append(f"• {mentor['name']} - {mentor['expertise']}\n"
+                                     f"  💼 Experience: {mentor['experience']} years\n"
+                                     f"  🎓 {mentor['background']}\n")
+                    lines.append("Would you like to connect with any of these mentors?")
+                    response["text"] = "\n".join(lines)
                 else:
                     response["text"] = "I'm currently updating our mentor database. In the meantime, would you like to tell me what kind of mentorship you're looking for?"
 
             # Check for education/course-related queries
-            elif any(word in processed_input for word in ['course', 'training', 'learn', 'study', 'education']):
+            elif 'education' in hits:
                 # Return information about digital marketing courses
-                response["text"] = "📚 Here are some recommended courses from JobsForHer Foundation:\n\n"
-                response["text"] += "1. Advanced Search Engine Optimization (SEO)\n"
-                response["text"] += "   🕒 Duration: 3 months\n"
-                response["text"] += "   💰 100% Scholarship Available\n\n"
-                response["text"] += "2. Advanced Pay Per Click (PPC) Program\n"
-                response["text"] += "   🕒 Duration: 3 months\n"
-                response["text"] += "   💰 100% Scholarship Available\n\n"
-                response["text"] += "3. Social Media & Digital Strategy\n"
-                response["text"] += "   🕒 Duration: 4 months\n"
-                response["text"] += "   💰 100% Scholarship Available\n\n"
-                response["text"] += "These courses are specifically designed for women returnees and include:\n"
-                response["text"] += "• Online, instructor-led format\n"
-                response["text"] += "• Self-paced learning\n"
-                response["text"] += "• Industry-recognized certification\n"
-                response["text"] += "• Career comeback support\n\n"
-                response["text"] += "Would you like more details about any of these courses?"
+                response["text"] = (
+                    "📚 Here are some recommended courses from JobsForHer Foundation:\n\n"
+                    "1. Advanced Search Engine Optimization (SEO)\n"
+                    "   🕒 Duration: 3 months\n"
+                    "   💰 100% Scholarship Available\n\n"
+                    "2. Advanced Pay Per Click (PPC) Program\n"
+                    "   🕒 Duration: 3 months\n"
+                    "   💰 100% Scholarship Available\n\n"
+                    "3. Social Media & Digital Strategy\n"
+                    "   🕒 Duration: 4 months\n"
+                    "   💰 100% Scholarship Available\n\n"
+                    "These courses are specifically designed for women returnees and include:\n"
+                    "• Online, instructor-led format\n"
+                    "• Self-paced learning\n"
+                    "• Industry-recognized certification\n"
+                    "• Career comeback support\n\n"
+                    "Would you like more details about any of these courses?"
+                )
 
             # Check for FAQs
-            faq_response = self.handle_faq(user_input)
+            faq_response = self._match_faq(input_lower)
             if faq_response:
                 response["text"] = faq_response
                 return response
 
             # Check for program discovery intent
-            if any(keyword in user_input.lower() for keyword in ['program', 'course', 'training', 'learn']):
+            if any(keyword in input_lower for keyword in ['program', 'course', 'training', 'learn']):
                 response["text"] = self.handle_program_discovery()
                 return response
 
             # Check for signup assistance
-            if any(keyword in user_input.lower() for keyword in ['sign up', 'join', 'register', 'signup']):
+            if any(keyword in input_lower for keyword in ['sign up', 'join', 'register', 'signup']):
                 response["text"] = self.handle_signup_assistance()
                 return response
 
             # Check for profile update intent
-            if any(keyword in user_input.lower() for keyword in ['profile', 'update profile', 'edit profile']):
+            if any(keyword in input_lower for keyword in ['profile', 'update profile', 'edit profile']):
                 response["text"] = "To update your profile:\n" + \
                                  "1. Go to 'My Profile'\n" + \
                                  "2. Click 'Edit'\n" + \
@@ -319,17 +358,18 @@ class SimpleAsha:
                                 "• Upcoming events 📅\n\n" + \
                                 "What would you like to explore?"
 
-            # Track successful response
-            self.analytics[session_id]["successful_responses"] += 1
+            with self._state_lock:
+                # Track successful response
+                self.analytics[session_id]["successful_responses"] += 1
 
-            # Store conversation history
-            if session_id not in self.conversation_history:
-                self.conversation_history[session_id] = []
-            self.conversation_history[session_id].append({
-                "user_input": user_input,
-                "response": response["text"] if response["text"] else "I'm here to help! Please let me know what you're looking for.",
-                "timestamp": datetime.now().isoformat()
-            })
+                # Store conversation history
+                if session_id not in self.conversation_history:
+                    self.conversation_history[session_id] = []
+                self.conversation_history[session_id].append({
+                    "user_input": user_input,
+                    "response": response["text"] if response["text"] else "I'm here to help! Please let me know what you're looking for.",
+                    "timestamp": datetime.now().isoformat()
+                })
 
             return response
 
@@ -337,16 +377,22 @@ class SimpleAsha:
             print(f"Error processing request: {str(e)}")
             return {"text": "I apologize, but I encountered an error. Please try rephrasing your question or contact support if the issue persists."}
 
+    def get_batch_responses(self, messages: List[Tuple[Optional[str], str]]) -> List[Dict]:
+        """Answer a batch of (session_id, message) pairs in order, one get_response call each."""
+        get_response = self.get_response
+        return [get_response(text, session_id) for session_id, text in messages]
+
     def get_analytics(self, session_id: Optional[str] = None) -> Dict:
         """Get analytics data for a session or all sessions."""
         if session_id:
             return self.analytics.get(session_id, {})
-        return {
-            "total_sessions": len(self.analytics),
-            "total_interactions": sum(s["total_interactions"] for s in self.analytics.values()),
-            "total_biased_queries": sum(s["biased_queries"] for s in self.analytics.values()),
-            "successful_responses": sum(s["successful_responses"] for s in self.analytics.values())
-        }
+        with self._state_lock:
+            return {
+                "total_sessions": len(self.analytics),
+                "total_interactions": sum(s["total_interactions"] for s in self.analytics.values()),
+                "total_biased_queries": sum(s["biased_queries"] for s in self.analytics.values()),
+                "successful_responses": sum(s["successful_responses"] for s in self.analytics.values())
+            }
 
     def get_conversation_history(self, session_id: str) -> List[Dict]:
         """Get conversation history for a session."""
@@ -361,13 +407,46 @@ class SimpleAsha:
             print(f"Error loading FAQs: {e}")
             return {'faqs': []}
 
+    def _build_keyword_scanner(self):
+        """Compile all intent keywords into one pattern that reports every category present."""
+        categories = {}
+        for category, keywords in self.INTENT_KEYWORDS.items():
+            for keyword in keywords:
+                categories.setdefault(keyword, set()).add(category)
+        # A keyword also implies the categories of every keyword it contains, so the
+        # longest keyword matched at a position stands in for all shorter ones there
+        self.keyword_categories = {
+            keyword: frozenset().union(*(cats for other, cats in categories.items() if other in keyword))
+            for keyword in categories
+        }
+        longest_first = sorted(self.keyword_categories, key=len, reverse=True)
+        self.keyword_pattern = re.compile('(?=(' + '|'.join(map(re.escape, longest_first)) + '))')
+        # Repeated inputs reuse the earlier scan; results are frozensets so they are safe to share
+        self._keyword_hits = lru_cache(maxsize=1024)(self._scan_keywords)
+
+    def _scan_keywords(self, text: str) -> frozenset:
+        """Return the INTENT_KEYWORDS categories with a keyword in text."""
+        hits = set()
+        for match in self.keyword_pattern.finditer(text):
+            hits |= self.keyword_categories[match.group(1)]
+        return frozenset(hits)
+
+    def _build_faq_index(self) -> List[Tuple[str, str]]:
+        """Index each distinct FAQ keyword against the answer of the first FAQ containing it."""
+        index = {}
+        for faq in self.faqs.get('faqs', []):
+            for keyword in faq['question'].lower().split():
+                index.setdefault(keyword, faq['answer'])
+        # Dicts keep insertion order, so keywords stay ordered by their first FAQ
+        return list(index.items())
+
     def handle_faq(self, query: str) -> str:
         """Find and return relevant FAQ answer."""
-        query = query.lower()
-        for faq in self.faqs.get('faqs', []):
-            if any(keyword in query for keyword in faq['question'].lower().split()):
-                return faq['answer']
-        return ""
+        return self._match_faq(query.lower())
+
+    def _match_faq(self, query_lower: str) -> str:
+        """Return the answer of the first indexed keyword found in lowercased text."""
+        return next((answer for keyword, answer in self.faq_index if keyword in query_lower), "")
 
     def handle_profile_update(self, user_id: str, updates: Dict) -> Dict:
         """Handle user profile updates."""
@@ -455,7 +534,7 @@ def main():
             user_input = input("\nYou: ").strip()
             
             # Check if user wants to exit
-            if user_input.lower() in ['exit', 'quit', 'bye', 'goodbye']:
+            if user_input.lower() in EXIT_COMMANDS:
                 print("\nAsha: Goodbye! Have a great day! 👋")
                 break
             
@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 class BiasDetector:
@@ -15,6 +16,12 @@ class BiasDetector:
             ]
         }
         
+        # Compile each pattern once instead of on every detect_bias call
+        self.compiled_patterns = {
+            bias_type: [re.compile(pattern) for pattern in patterns]
+            for bias_type, patterns in self.bias_patterns.items()
+        }
+        
         self.positive_alternatives = {
             'gender_bias': [
                 "All qualified candidates are welcome",
@@ -27,28 +34,36 @@ class BiasDetector:
                 "Opportunities are open to all qualified professionals"
             ]
         }
+        
+        # Repeated queries are common across sessions; memoize the scan per lowercased text
+        self._scan_cached = lru_cache(maxsize=512)(self._scan)
 
     def detect_bias(self, text: str) -> Tuple[bool, Dict[str, List[str]], List[str]]:
         """
         Detect different types of bias in the given text.
         Returns: (has_bias, found_biases, suggestions)
         """
-        found_biases = {}
+        has_bias, found_biases, suggestions = self._scan_cached(text.lower())
+        # Hand out fresh containers so callers cannot mutate the cached result
+        return has_bias, {bias_type: list(matches) for bias_type, matches in found_biases}, list(suggestions)
+
+    def _scan(self, text_lower: str) -> Tuple[bool, Tuple[Tuple[str, Tuple[str, ...]], ...], Tuple[str, ...]]:
+        """Run the bias patterns over lowercased text and return an immutable result."""
+        found_biases = []
         suggestions = []
         has_bias = False
 
-        for bias_type, patterns in self.bias_patterns.items():
+        for bias_type, patterns in self.compiled_patterns.items():
             matches = []
             for pattern in patterns:
-                found = re.finditer(pattern, text.lower())
-                matches.extend([match.group() for match in found])
+                matches.extend([match.group() for match in pattern.finditer(text_lower)])
             
             if matches:
                 has_bias = True
-                found_biases[bias_type] = matches
+                found_biases.append((bias_type, tuple(matches)))
                 suggestions.extend(self.positive_alternatives[bias_type])
 
-        return has_bias, found_biases, list(set(suggestions))
+        return has_bias, tuple(found_biases), tuple(set(suggestions))
 
     def get_corrected_text(self, text: str) -> str:
         """
@@ -1,8 +1,8 @@
-import json
 import csv
+import orjson
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional
-import pandas as pd
 from pathlib import Path
 
 class KnowledgeBase:
@@ -11,6 +11,8 @@ class KnowledgeBase:
         self.cache = {}
         self.cache_ttl = 300  # 5 minutes
         self.last_update = {}
+        # Chat requests run on worker threads; refresh each cache entry only once
+        self._refresh_lock = threading.Lock()
         
     def _needs_update(self, key: str) -> bool:
         """Check if the cache needs updating."""
@@ -20,54 +22,57 @@ class KnowledgeBase:
 
     def get_job_listings(self, filters: Optional[Dict] = None) -> List[Dict]:
         """Get job listings with optional filters."""
-        if self._needs_update('jobs'):
-            try:
-                jobs_df = pd.read_csv(self.data_dir / 'job_listing_data.csv')
-                jobs_list = jobs_df.fillna('').to_dict('records')
-                # Clean up the data
-                cleaned_jobs = []
-                for job in jobs_list:
-                    cleaned_job = {
-                        'title': job.get('title', ''),
-                        'company': job.get('company', ''),
-                        'location': job.get('location', ''),
-                        'salary': job.get('salary', 'Competitive'),
-                        'type': job.get('type', 'Full-time'),
-                        'benefits': job.get('benefits', '').split(',') if job.get('benefits') else []
-                    }
-                    cleaned_jobs.append(cleaned_job)
-                self.cache['jobs'] = cleaned_jobs
-                self.last_update['jobs'] = datetime.now()
-            except Exception as e:
-                print(f"Error loading job listings: {e}")
-                # Return mock data if file read fails
-                self.cache['jobs'] = [
-                    {
-                        'title': 'Senior Software Engineer',
-                        'company': 'TechCo',
-                        'location': 'Bangalore',
-                        'salary': 'Competitive',
-                        'type': 'Full-time',
-                        'benefits': ['Health insurance', 'Flexible hours']
-                    },
-                    {
-                        'title': 'Product Manager',
-                        'company': 'InnovateX',
-                        'location': 'Mumbai',
-                        'salary': 'Competitive',
-                        'type': 'Full-time',
-                        'benefits': ['401k', 'Health coverage']
-                    },
-                    {
-                        'title': 'Data Scientist',
-                        'company': 'DataTech',
-                        'location': 'Delhi',
-                        'salary': 'Competitive',
-                        'type': 'Remote',
-                        'benefits': ['Remote work', 'Stock options']
-                    }
-                ]
-                self.last_update['jobs'] = datetime.now()
+        with self._refresh_lock:
+            if self._needs_update('jobs'):
+                # pandas is only needed to read the CSV; importing it lazily keeps chatbot start-up light
+                import pandas as pd
+                try:
+                    jobs_df = pd.read_csv(self.data_dir / 'job_listing_data.csv')
+                    jobs_list = jobs_df.fillna('').to_dict('records')
+                    # Clean up the data
+                    cleaned_jobs = []
+                    for job in jobs_list:
+                        cleaned_job = {
+                            'title': job.get('title', ''),
+                            'company': job.get('company', ''),
+                            'location': job.get('location', ''),
+                            'salary': job.get('salary', 'Competitive'),
+                            'type': job.get('type', 'Full-time'),
+                            'benefits': job.get('benefits', '').split(',') if job.get('benefits') else []
+                        }
+                        cleaned_jobs.append(cleaned_job)
+                    self.cache['jobs'] = cleaned_jobs
+                    self.last_update['jobs'] = datetime.now()
+                except Exception as e:
+                    print(f"Error loading job listings: {e}")
+                    # Return mock data if file read fails
+                    self.cache['jobs'] = [
+                        {
+                            'title': 'Senior Software Engineer',
+                            'company': 'TechCo',
+                            'location': 'Bangalore',
+                            'salary': 'Competitive',
+                            'type': 'Full-time',
+                            'benefits': ['Health insurance', 'Flexible hours']
+                        },
+                        {
+                            'title': 'Product Manager',
+                            'company': 'InnovateX',
+                            'location': 'Mumbai',
+                            'salary': 'Competitive',
+                            'type': 'Full-time',
+                            'benefits': ['401k', 'Health coverage']
+                        },
+                        {
+                            'title': 'Data Scientist',
+                            'company': 'DataTech',
+                            'location': 'Delhi',
+                            'salary': 'Competitive',
+                            'type': 'Remote',
+                            'benefits': ['Remote work', 'Stock options']
+                        }
+                    ]
+                    self.last_update['jobs'] = datetime.now()
 
         jobs = self.cache.get('jobs', [])
         
@@ -81,68 +86,70 @@ class KnowledgeBase:
 
     def get_events(self) -> List[Dict]:
         """Get upcoming events."""
-        if self._needs_update('events'):
-            try:
-                with open(self.data_dir / 'session_details.json', 'r') as f:
-                    data = json.load(f)
-                    self.cache['events'] = data.get('events', [])
+        with self._refresh_lock:
+            if self._needs_update('events'):
+                try:
+                    with open(self.data_dir / 'session_details.json', 'rb') as f:
+                        data = orjson.loads(f.read())
+                        self.cache['events'] = data.get('events', [])
+                        self.last_update['events'] = datetime.now()
+                except Exception as e:
+                    print(f"Error loading events: {e}")
+                    # Return mock data if file read fails
+                    self.cache['events'] = [
+                        {
+                            'title': 'Women in Tech Leadership Summit',
+                            'date': '2025-05-15',
+                            'location': 'Bangalore',
+                            'type': 'Conference'
+                        },
+                        {
+                            'title': 'Career Development Workshop',
+                            'date': '2025-05-20',
+                            'location': 'Virtual',
+                            'type': 'Workshop'
+                        },
+                        {
+                            'title': 'Tech Skills Bootcamp',
+                            'date': '2025-06-01',
+                            'location': 'Mumbai',
+                            'type': 'Training'
+                        }
+                    ]
                     self.last_update['events'] = datetime.now()
-            except Exception as e:
-                print(f"Error loading events: {e}")
-                # Return mock data if file read fails
-                self.cache['events'] = [
-                    {
-                        'title': 'Women in Tech Leadership Summit',
-                        'date': '2025-05-15',
-                        'location': 'Bangalore',
-                        'type': 'Conference'
-                    },
-                    {
-                        'title': 'Career Development Workshop',
-                        'date': '2025-05-20',
-                        'location': 'Virtual',
-                        'type': 'Workshop'
-                    },
-                    {
-                        'title': 'Tech Skills Bootcamp',
-                        'date': '2025-06-01',
-                        'location': 'Mumbai',
-                        'type': 'Training'
-                    }
-                ]
-                self.last_update['events'] = datetime.now()
         return self.cache.get('events', [])
 
     def get_mentorship_programs(self) -> List[Dict]:
         """Get available mentorship programs."""
-        if self._needs_update('mentorship'):
-            try:
-                with open(self.data_dir / 'session_details.json', 'r') as f:
-                    data = json.load(f)
-                    self.cache['mentorship'] = data.get('mentorship_programs', [])
+        with self._refresh_lock:
+            if self._needs_update('mentorship'):
+                try:
+                    with open(self.data_dir / 'session_details.json', 'rb') as f:
+                        data = orjson.loads(f.read())
+                        self.cache['mentorship'] = data.get('mentorship_programs', [])
+                        self.last_update['mentorship'] = datetime.now()
+                except Exception as e:
+                    print(f"Error loading mentorship programs: {e}")
+                    # Return mock data if file read fails
+                    self.cache['mentorship'] = [
+                        {
+                            'name': 'Sarah Johnson',
+                            'expertise': 'Tech Leadership',
+                            'experience': 15,
+                            'background': 'Former CTO at TechCorp'
+                        },
+                        {
+                            'name': 'Priya Sharma',
+                            'expertise': 'Product Management',
+                            'experience': 10,
+                            'background': 'Senior PM at InnovateX'
+                        },
+                        {
+                            'name': 'Lisa Chen',
+                            'expertise': 'Data Science',
+                            'experience': 8,
+                            'background': 'Lead Data Scientist at DataTech'
+                        }
+                    ]
                     self.last_update['mentorship'] = datetime.now()
-            except Exception as e:
-                print(f"Error loading mentorship programs: {e}")
-                # Return mock data if file read fails
-                self.cache['mentorship'] = [
-                    {
-                        'name': 'Sarah Johnson',
-                        'expertise': 'Tech Leadership',
-                        'experience': 15,
-                        'background': 'Former CTO at TechCorp'
-                    },
-                    {
-                        'name': 'Priya Sharma',
-                        'expertise': 'Product Management',
-                        'experience': 10,
-                        'background': 'Senior PM at InnovateX'
-                    },
-                    {
-                        'name': 'Lisa Chen',
-                        'expertise': 'Data Science',
-                        'experience': 8,
-                        'background': 'Lead Data Scientist at DataTech'
-                    }
-                ]
-                self.last_update['mentorship'] = datetime.now()
         return self.cache.get('mentorship', [])